@@ -9,25 +9,102 @@ Patterns:
 - checkerboard: Animated checkerboard pattern
 - gradient: Rotating color gradient
 - text: Custom text overlay
+
+FORMAT selects the frame file format: png (default, lossless), jpeg or webp;
+QUALITY (1-100, default 90) tunes the lossy ones.
+
+When numba is installed, the gradient pattern is rendered by a fused,
+multi-threaded kernel instead of whole-frame NumPy temporaries. USE_GPU=1
+renders it with CuPy on a CUDA device instead (CPU fallback if unavailable).
+WORKERS=N (default 1) generates and saves frames in N processes for high FPS or
+large resolutions.
+The lossy formats encode much faster than PNG's zlib pass, and the stream
+helper re-encodes frames to H.264 anyway.
+
+SEEDER_MODE=pipe skips files altogether: raw rgb24 frames are written to the
+FIFO at FIFO_PATH (created if missing) for
+`stream_helper start --pipe WIDTHxHEIGHT --source FIFO_PATH` to read on the
+same host, with no image encode/decode per frame.
 """
 import os
 import sys
+import errno
 import time
 import math
 import signal
+import functools
+import queue
+import threading
+import collections
+import itertools
+import multiprocessing
 from datetime import datetime
 from pathlib import Path
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
 except ImportError:
     print("ERROR: Pillow not installed", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy not installed", file=sys.stderr)
+    sys.exit(1)
+
+try:
+    import numba  # optional: fused, multi-threaded gradient kernel
+except ImportError:
+    numba = None
+
+
+def _load_cupy():
+    """CuPy when USE_GPU=1 and a CUDA device is usable, else None (silent CPU fallback)."""
+    if os.getenv("USE_GPU", "0") != "1":
+        return None
+    try:
+        import cupy
+        cupy.cuda.runtime.getDeviceCount()
+    except Exception:
+        print("[seeder] USE_GPU=1 but CuPy/CUDA is unavailable; rendering on the CPU", file=sys.stderr)
+        return None
+    return cupy
+
+
+cp = _load_cupy()
+
 
 # Global flag for graceful shutdown
 shutdown_requested = False
 
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+# Frame numbers and timestamps only change digits, so they are measured as zeros.
+_DIGITS_AS_ZERO = str.maketrans("123456789", "000000000")
+
+# FORMAT -> (file extension, Image.save keyword arguments)
+FRAME_FORMATS = {
+    "png": (".png", {"format": "PNG"}),
+    "jpeg": (".jpg", {"format": "JPEG", "quality": 90}),
+    "webp": (".webp", {"format": "WEBP", "quality": 90, "method": 0}),
+}
+
+GLOW_COLOR = (255, 83, 217)
+# The neon glow used to be five full-frame alpha composites of the same text at
+# alpha 100/offset (offset 5..1); stacked, they equal one pass at this opacity.
+GLOW_OPACITY = 1 - math.prod(1 - int(100 / offset) / 255 for offset in range(5, 0, -1))
+# Those composites were meant to spread the glow; a blurred, then boosted, text mask does.
+GLOW_RADIUS = 6
+# Gain applied after the blur: lifts the faint tail so the halo reads wider, like a
+# dilated mask, for one 256-entry lookup instead of a MaxFilter pass.
+GLOW_SPREAD = 2.5
+# 128 + 127*sin per whole degree at the R, G, B phases (0, 120, 240), truncated like int();
+# the animated patterns index this instead of evaluating sines per pixel.
+HUE_LUT = np.trunc(128 + 127 * np.sin(np.radians(np.arange(360)[:, None] + (0, 120, 240)))).astype(np.uint8)
+HUE_LUT.flags.writeable = False
+_GLOW_LUT = [min(255, round(level * GLOW_SPREAD)) for level in range(256)]
+
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
@@ -37,54 +114,73 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
+@functools.lru_cache(maxsize=None)
+def load_font(path: str, size: int):
+    """Open a TrueType font once per (path, size), falling back to Pillow's default font."""
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _measure(text: str, font):
+    return font.getbbox(text)
+
+
+def text_bbox(text: str, font):
+    """Bounding box of `text` at (0, 0); per-frame digits share one cached measurement."""
+    return _measure(text.translate(_DIGITS_AS_ZERO), font)
+
+
+def vertical_gradient(width: int, height: int, top, span):
+    """Build an RGB image whose rows go from `top` to `top + span` (per channel), top to bottom."""
+    ratio = np.arange(height) / height
+    rows = (np.asarray(top, dtype=np.float64) + ratio[:, None] * np.asarray(span, dtype=np.float64)).astype(np.uint8)
+    # Only the 1-pixel-wide column is computed; a nearest-neighbour stretch writes
+    # the full frame in a single pass (no full-size ndarray copy, no fromarray copy).
+    return Image.fromarray(rows[:, None, :], 'RGB').resize((width, height), Image.NEAREST)
+
+
+@functools.lru_cache(maxsize=8)
+def timestamp_background(width: int, height: int):
+    """The timestamp pattern's static gradient (copy before drawing on it)."""
+    return vertical_gradient(width, height, (15, 20, 45), (80, 50, 120))
+
+
 def generate_timestamp_frame(frame_num: int, width: int, height: int):
     """Generate a test frame with frame number and timestamp."""
-    # Create gradient background (dark blue to purple)
-    img = Image.new('RGB', (width, height))
+    # Gradient background (dark blue to purple), built once per size
+    img = timestamp_background(width, height).copy()
     draw = ImageDraw.Draw(img)
     
-    # Draw gradient background
-    for y in range(height):
-        ratio = y / height
-        r = int(15 + ratio * 80)
-        g = int(20 + ratio * 50)
-        b = int(45 + ratio * 120)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-    
     # Add neon-style frame info
-    try:
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 120)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 40)
-    except Exception:
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_large = load_font(FONT_BOLD, 120)
+    font_small = load_font(FONT_REGULAR, 40)
     
     # Frame number (large, centered)
     frame_text = f"Frame {frame_num:05d}"
-    bbox = draw.textbbox((0, 0), frame_text, font=font_large)
+    bbox = text_bbox(frame_text, font_large)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
     x = (width - text_width) // 2
     y = (height - text_height) // 2 - 50
     
-    # Neon glow effect
-    img_rgba = img.convert('RGBA')
-    glow_color = (255, 83, 217)
-    for offset in range(5, 0, -1):
-        alpha = int(100 / offset)
-        glow_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        glow_draw = ImageDraw.Draw(glow_img)
-        glow_draw.text((x, y), frame_text, font=font_large, fill=(*glow_color, alpha))
-        img_rgba = Image.alpha_composite(img_rgba, glow_img)
-    
-    img = img_rgba.convert('RGB')
-    draw = ImageDraw.Draw(img)
+    # Neon glow effect: one blurred, boosted text-sized mask pasted straight onto the RGB frame
+    bx0, by0, bx1, by1 = text_bbox(frame_text, font_large)
+    # The cached box is measured on zeros (room for wider digits) plus the blur's reach
+    pad = 4 + 3 * GLOW_RADIUS
+    x0, y0, x1, y1 = x + bx0 - pad, y + by0 - pad, x + bx1 + pad, y + by1 + pad
+    glow_mask = Image.new('L', (x1 - x0, y1 - y0), 0)
+    ImageDraw.Draw(glow_mask).text((x - x0, y - y0), frame_text, font=font_large, fill=round(255 * GLOW_OPACITY))
+    glow_mask = glow_mask.filter(ImageFilter.GaussianBlur(GLOW_RADIUS)).point(_GLOW_LUT)
+    img.paste(GLOW_COLOR, (x0, y0, x1, y1), glow_mask)
     draw.text((x, y), frame_text, font=font_large, fill=(45, 226, 255))
     
     # Timestamp
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
     time_text = f"Generated: {timestamp}"
-    bbox = draw.textbbox((0, 0), time_text, font=font_small)
+    bbox = text_bbox(time_text, font_small)
     text_width = bbox[2] - bbox[0]
     x = (width - text_width) // 2
     y = height - 80
@@ -97,11 +193,9 @@ def generate_timestamp_frame(frame_num: int, width: int, height: int):
     return img
 
 
-def generate_colorbars_frame(frame_num: int, width: int, height: int):
-    """Generate SMPTE color bars test pattern."""
-    img = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(img)
-    
+@functools.lru_cache(maxsize=8)
+def colorbars_base(width: int, height: int):
+    """SMPTE color bars without the counter; frame-invariant, so built once per size (copy before drawing)."""
     # SMPTE color bars (simplified)
     colors = [
         (192, 192, 192),  # 75% White
@@ -116,29 +210,31 @@ def generate_colorbars_frame(frame_num: int, width: int, height: int):
     bar_width = width // len(colors)
     bar_height = int(height * 0.66)
     
-    # Draw main color bars
+    # Each section is one scanline repeated down the frame
+    top_row = np.empty((width, 3), dtype=np.uint8)
     for i, color in enumerate(colors):
-        x1 = i * bar_width
-        x2 = (i + 1) * bar_width if i < len(colors) - 1 else width
-        draw.rectangle([x1, 0, x2, bar_height], fill=color)
+        top_row[i * bar_width:(i + 1) * bar_width if i < len(colors) - 1 else width] = color
     
-    # Draw bottom section with black and white bars
-    bottom_start = bar_height
-    bottom_height = height - bar_height
+    # Bottom section with black and white bars
     segment_width = width // 7
-    
+    bottom_row = np.empty((width, 3), dtype=np.uint8)
     for i in range(7):
-        x1 = i * segment_width
-        x2 = (i + 1) * segment_width if i < 6 else width
         intensity = int(255 * (i / 6))
-        color = (intensity, intensity, intensity)
-        draw.rectangle([x1, bottom_start, x2, height], fill=color)
+        bottom_row[i * segment_width:(i + 1) * segment_width if i < 6 else width] = intensity
+    
+    base = np.empty((height, width, 3), dtype=np.uint8)
+    base[:bar_height] = top_row
+    base[bar_height:] = bottom_row
+    return Image.fromarray(base, 'RGB')
+
+
+def generate_colorbars_frame(frame_num: int, width: int, height: int):
+    """Generate SMPTE color bars test pattern."""
+    img = colorbars_base(width, height).copy()
+    draw = ImageDraw.Draw(img)
     
     # Add frame counter
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 30)
-    except:
-        font = ImageFont.load_default()
+    font = load_font(FONT_REGULAR, 30)
     
     text = f"Frame {frame_num:05d} | SMPTE Color Bars"
     draw.text((20, 20), text, font=font, fill=(255, 255, 255))
@@ -148,91 +244,99 @@ def generate_colorbars_frame(frame_num: int, width: int, height: int):
 
 def generate_checkerboard_frame(frame_num: int, width: int, height: int):
     """Generate animated checkerboard pattern."""
-    img = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(img)
-    
     # Animated checker size based on frame number
     checker_size = 40 + int(20 * math.sin(frame_num * 0.05))
     
-    # Draw checkerboard
-    for y in range(0, height, checker_size):
-        for x in range(0, width, checker_size):
-            row = y // checker_size
-            col = x // checker_size
-            
-            # Alternate colors with animation
-            if (row + col) % 2 == 0:
-                # Animated color transition
-                hue = (frame_num * 2) % 360
-                r = int(128 + 127 * math.sin(math.radians(hue)))
-                g = int(128 + 127 * math.sin(math.radians(hue + 120)))
-                b = int(128 + 127 * math.sin(math.radians(hue + 240)))
-                color = (r, g, b)
-            else:
-                color = (20, 20, 20)
-            
-            draw.rectangle([x, y, x + checker_size, y + checker_size], fill=color)
+    # Animated color transition (the same for every lit square)
+    hue = (frame_num * 2) % 360
+    r, g, b = HUE_LUT[hue]
+    
+    # Draw checkerboard: only two distinct scanlines exist (even and odd square rows),
+    # so build those from column parity and gather them by row parity.
+    colors = np.array([(r, g, b), (20, 20, 20)], dtype=np.uint8)
+    col_parity = (np.arange(width) // checker_size) & 1
+    scanlines = np.stack([colors[col_parity], colors[col_parity ^ 1]])
+    row_parity = (np.arange(height) // checker_size) & 1
+    img = Image.fromarray(scanlines[row_parity], 'RGB')
+    draw = ImageDraw.Draw(img)
     
     # Add frame counter
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 50)
-    except:
-        font = ImageFont.load_default()
+    font = load_font(FONT_BOLD, 50)
     
     text = f"Frame {frame_num:05d}"
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = text_bbox(text, font)
     text_width = bbox[2] - bbox[0]
     x = (width - text_width) // 2
     y = height - 100
     
-    # Text with outline
-    for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-        draw.text((x + dx, y + dy), text, font=font, fill=(0, 0, 0))
-    draw.text((x, y), text, font=font, fill=(255, 255, 255))
+    # Text with outline: FreeType strokes the glyphs in the same rasterization pass
+    draw.text((x, y), text, font=font, fill=(255, 255, 255), stroke_width=2, stroke_fill=(0, 0, 0))
     
     return img
 
 
+@functools.lru_cache(maxsize=8)
+def polar_grid(width: int, height: int, xp=np):
+    """Per-pixel (whole-degree angle from center in 0..359, distance fade factor) for the gradient pattern.
+
+    `xp` is the array module (NumPy, or CuPy to keep the grid on the GPU).
+    """
+    ys, xs = xp.indices((height, width), dtype=xp.float64)
+    dx = xs - width / 2
+    dy = ys - height / 2
+    angle_index = xp.floor(xp.degrees(xp.arctan2(dy, dx))).astype(xp.int16) % 360
+    fade = (1 - xp.minimum(1.0, xp.hypot(dx, dy) / (min(width, height) / 2)) * 0.5).astype(xp.float32)
+    if xp is np:
+        angle_index.flags.writeable = False
+        fade.flags.writeable = False
+    return angle_index, fade
+
+
+def _gradient_channels(xp, out, angle_index, fade, angle):
+    # Color by whole-degree angle from the hue table, faded based on distance
+    levels = xp.asarray(HUE_LUT)[(angle_index + angle) % 360]
+    out[...] = levels * fade[..., None]
+    return out
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _render_gradient(out, angle_index, fade, angle, lut):
+        # One pass per pixel writing uint8 directly from the hue table.
+        height, width = fade.shape
+        for y in numba.prange(height):
+            for x in range(width):
+                hue = (angle_index[y, x] + angle) % 360
+                for channel in range(3):
+                    out[y, x, channel] = int(lut[hue, channel] * fade[y, x])
+        return out
+
+
 def generate_gradient_frame(frame_num: int, width: int, height: int):
     """Generate rotating color gradient pattern."""
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-    
     # Rotating gradient
     angle = (frame_num * 3) % 360
     
-    for y in range(height):
-        for x in range(width):
-            # Distance from center
-            dx = x - width / 2
-            dy = y - height / 2
-            dist = math.sqrt(dx * dx + dy * dy)
-            
-            # Angle from center
-            pixel_angle = (math.degrees(math.atan2(dy, dx)) + angle) % 360
-            
-            # Color based on angle and distance
-            r = int(128 + 127 * math.sin(math.radians(pixel_angle)))
-            g = int(128 + 127 * math.sin(math.radians(pixel_angle + 120)))
-            b = int(128 + 127 * math.sin(math.radians(pixel_angle + 240)))
-            
-            # Fade based on distance
-            fade = min(1.0, dist / (min(width, height) / 2))
-            r = int(r * (1 - fade * 0.5))
-            g = int(g * (1 - fade * 0.5))
-            b = int(b * (1 - fade * 0.5))
-            
-            pixels[x, y] = (r, g, b)
+    # Angle from center; geometry is per-size, only the rotation changes per frame
+    if cp is not None:
+        # Everything stays on the device; only the finished uint8 frame is copied back
+        angle_index, fade = polar_grid(width, height, cp)
+        rgb = cp.asnumpy(_gradient_channels(cp, cp.empty((height, width, 3), dtype=cp.uint8), angle_index, fade, angle))
+    else:
+        angle_index, fade = polar_grid(width, height)
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        if numba is not None:
+            _render_gradient(rgb, angle_index, fade, angle, HUE_LUT)
+        else:
+            _gradient_channels(np, rgb, angle_index, fade, angle)
+    img = Image.fromarray(rgb, 'RGB')
     
     # Add frame counter
     draw = ImageDraw.Draw(img)
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
-    except:
-        font = ImageFont.load_default()
+    font = load_font(FONT_BOLD, 60)
     
     text = f"Frame {frame_num:05d}"
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = text_bbox(text, font)
     text_width = bbox[2] - bbox[0]
     x = (width - text_width) // 2
     y = (height - (bbox[3] - bbox[1])) // 2
@@ -249,15 +353,11 @@ def generate_text_frame(frame_num: int, width: int, height: int, custom_text: st
     img = Image.new('RGB', (width, height), color=(30, 30, 50))
     draw = ImageDraw.Draw(img)
     
-    try:
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 80)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 40)
-    except:
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_large = load_font(FONT_BOLD, 80)
+    font_small = load_font(FONT_REGULAR, 40)
     
     # Custom text (centered)
-    bbox = draw.textbbox((0, 0), custom_text, font=font_large)
+    bbox = text_bbox(custom_text, font_large)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
     x = (width - text_width) // 2
@@ -266,7 +366,7 @@ def generate_text_frame(frame_num: int, width: int, height: int, custom_text: st
     
     # Frame counter
     frame_text = f"Frame {frame_num:05d}"
-    bbox = draw.textbbox((0, 0), frame_text, font=font_small)
+    bbox = text_bbox(frame_text, font_small)
     text_width = bbox[2] - bbox[0]
     x = (width - text_width) // 2
     y = height - 80
@@ -275,6 +375,62 @@ def generate_text_frame(frame_num: int, width: int, height: int, custom_text: st
     return img
 
 
+def open_fifo(path: Path):
+    """Create the FIFO if needed and open it for writing once a reader attaches.
+
+    Returns None if shutdown is requested while waiting.
+    """
+    if not path.exists():
+        os.mkfifo(path)
+    print(f"[seeder] Waiting for a reader on {path}")
+    while not shutdown_requested:
+        try:
+            # Non-blocking open fails with ENXIO until a reader exists, so signals stay responsive.
+            fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if e.errno != errno.ENXIO:
+                raise
+            time.sleep(0.2)
+            continue
+        os.set_blocking(fd, True)
+        return os.fdopen(fd, "wb", buffering=0)
+    return None
+
+
+def frame_writer(frames: queue.Queue, save_options: dict) -> None:
+    """Encode and write queued (image, path) pairs until a None sentinel arrives."""
+    while True:
+        item = frames.get()
+        if item is None:
+            return
+        img, output_path = item
+        try:
+            img.save(output_path, **save_options)
+        except OSError as e:
+            print(f"[seeder] Warning: Could not write {output_path.name}: {e}", file=sys.stderr)
+
+
+def render_frame(generator, frame_num: int, width: int, height: int, output_path, save_options: dict):
+    """Pool task: generate one frame and save it (output_path) or return its raw rgb24 bytes (pipe mode)."""
+    img = generator(frame_num, width, height)
+    if output_path is None:
+        return img.tobytes()
+    # Workers finish out of order; a dot-prefixed temp name keeps readers off half-written files
+    partial_path = output_path.with_name(f".{output_path.name}")
+    try:
+        img.save(partial_path, **save_options)
+        os.replace(partial_path, output_path)
+    except OSError as e:
+        print(f"[seeder] Warning: Could not write {output_path.name}: {e}", file=sys.stderr)
+        partial_path.unlink(missing_ok=True)
+    return None
+
+
+def _pool_worker_init():
+    # Ctrl-C is handled by the main process, which closes the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
 def main():
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, signal_handler)
@@ -287,64 +443,146 @@ def main():
     custom_text = os.getenv("CUSTOM_TEXT", "Defora Test")
     width = int(os.getenv("WIDTH", "1280"))
     height = int(os.getenv("HEIGHT", "720"))
+    frame_format = os.getenv("FORMAT", "png").lower()
+    if frame_format == "jpg":
+        frame_format = "jpeg"
+    if frame_format not in FRAME_FORMATS:
+        print(f"[seeder] Unknown FORMAT {frame_format!r}, using png", file=sys.stderr)
+        frame_format = "png"
+    frame_ext, save_options = FRAME_FORMATS[frame_format]
+    if "quality" in save_options and os.getenv("QUALITY"):
+        save_options = {**save_options, "quality": int(os.getenv("QUALITY"))}
+    pipe_mode = os.getenv("SEEDER_MODE", "files").lower() == "pipe"
+    fifo_path = Path(os.getenv("FIFO_PATH", "/tmp/frames.fifo"))
+    workers = max(1, int(os.getenv("WORKERS", "1")))
+    if workers > 1 and cp is not None:
+        print("[seeder] WORKERS is ignored with USE_GPU=1 (CUDA does not survive fork)", file=sys.stderr)
+        workers = 1
     
     # Create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if not pipe_mode:
+        output_dir.mkdir(parents=True, exist_ok=True)
     
     # Clear existing frames if requested
-    if clear:
+    if clear and not pipe_mode:
         print(f"[seeder] Clearing existing frames in {output_dir}")
-        for frame_file in output_dir.glob("frame_*.png"):
+        frame_exts = {ext for ext, _ in FRAME_FORMATS.values()}
+        # .frame_* are partial saves left behind by a WORKERS pool that was killed mid-write
+        for frame_file in itertools.chain(output_dir.glob("frame_*.*"), output_dir.glob(".frame_*.*")):
+            if frame_file.suffix not in frame_exts:
+                continue
             try:
                 frame_file.unlink()
             except Exception as e:
                 print(f"[seeder] Warning: Could not delete {frame_file.name}: {e}", file=sys.stderr)
     
     print(f"[seeder] Starting frame generation at {fps} FPS")
-    print(f"[seeder] Output directory: {output_dir}")
+    if pipe_mode:
+        print(f"[seeder] Output FIFO: {fifo_path} (raw rgb24)")
+    else:
+        print(f"[seeder] Output directory: {output_dir}")
+        print(f"[seeder] Format: {frame_format}")
     print(f"[seeder] Pattern: {pattern}")
     print(f"[seeder] Resolution: {width}x{height}")
+    if workers > 1:
+        print(f"[seeder] Workers: {workers}")
     
     frame_num = 1
     frame_delay = 1.0 / fps
     
-    # Pattern generator function
-    def generate_text_with_custom_text(fn, w, h):
-        return generate_text_frame(fn, w, h, custom_text)
-    
+    # Pattern generator function (module-level callables, so pool workers can unpickle them)
     pattern_generators = {
         'timestamp': generate_timestamp_frame,
         'colorbars': generate_colorbars_frame,
         'checkerboard': generate_checkerboard_frame,
         'gradient': generate_gradient_frame,
-        'text': generate_text_with_custom_text,
+        'text': functools.partial(generate_text_frame, custom_text=custom_text),
     }
     
     generator = pattern_generators.get(pattern, generate_timestamp_frame)
     
+    def frame_path(num: int) -> Path:
+        return output_dir / f"frame_{num:05d}{frame_ext}"
+    
+    fifo = open_fifo(fifo_path) if pipe_mode else None
+    # WORKERS > 1: frames are generated (and saved) by a process pool a few frames
+    # ahead; results are consumed in frame order so the pipe stays sequential.
+    pool = None
+    pending = collections.deque()
+    queued_num = frame_num
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=_pool_worker_init, maxtasksperchild=1000)
+    # Files are encoded on a writer thread (Pillow releases the GIL while encoding)
+    # so the next frame is generated while the previous one is saved.
+    frames = queue.Queue(maxsize=4)
+    writer = None
+    if not pipe_mode and pool is None:
+        writer = threading.Thread(target=frame_writer, args=(frames, save_options), name="frame-writer", daemon=True)
+        writer.start()
+    
     try:
-        while not shutdown_requested:
-            start_time = time.time()
-            
+        # Absolute monotonic schedule: a slow frame doesn't push every later one back
+        next_deadline = time.monotonic()
+        while not shutdown_requested and (fifo is not None or not pipe_mode):
             # Generate frame
-            img = generator(frame_num, width, height)
-            output_path = output_dir / f"frame_{frame_num:05d}.png"
-            img.save(output_path)
+            if pool is not None:
+                while len(pending) < 2 * workers:
+                    target = None if pipe_mode else frame_path(queued_num)
+                    pending.append(pool.apply_async(
+                        render_frame, (generator, queued_num, width, height, target, save_options)
+                    ))
+                    queued_num += 1
+                raw = pending.popleft().get()
+            else:
+                img = generator(frame_num, width, height)
+                raw = img.tobytes() if pipe_mode else None
+            if fifo is not None:
+                try:
+                    fifo.write(raw)
+                except BrokenPipeError:
+                    print("[seeder] Reader went away", file=sys.stderr)
+                    try:
+                        fifo.close()
+                    except BrokenPipeError:
+                        pass
+                    fifo = open_fifo(fifo_path)
+                    if fifo is None:
+                        break
+                output_name = fifo_path.name
+            else:
+                output_path = frame_path(frame_num)
+                if pool is None:
+                    frames.put((img, output_path))
+                output_name = output_path.name
             
             # Log every 10th frame
             if frame_num % 10 == 0:
-                print(f"[seeder] Generated frame {frame_num:05d} -> {output_path.name}")
+                print(f"[seeder] Generated frame {frame_num:05d} -> {output_name}")
             
             frame_num += 1
             
-            # Sleep to maintain FPS
-            elapsed = time.time() - start_time
-            sleep_time = max(0, frame_delay - elapsed)
-            time.sleep(sleep_time)
+            # Sleep to maintain FPS (encoding overlaps with this wait)
+            next_deadline += frame_delay
+            now = time.monotonic()
+            if now < next_deadline:
+                time.sleep(next_deadline - now)
+            else:
+                next_deadline = now  # fell behind: drop the lag instead of bursting to catch up
             
     except KeyboardInterrupt:
         print(f"\n[seeder] Interrupted. Generated {frame_num - 1} frames total.")
     finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if writer is not None:
+            frames.put(None)
+            writer.join()
+        if fifo is not None:
+            try:
+                fifo.close()
+            except BrokenPipeError:
+                pass
         print(f"[seeder] Stopped. Generated {frame_num - 1} frames total.")
         sys.exit(0)
 
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+from defora_cli.control_bridge import AckBatcher, handle_batch, handle_message, process_batch
+
+
+class FakeClient:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, key, val):
+        self.writes.append((key, val))
+
+
+def test_handle_message_forwards_payload_keys():
+    client = FakeClient()
+    result = handle_message(client, b'{"controlType": "liveParam", "payload": {"cfg": 7.5, "strength": 0.6}}')
+    assert result == "forwarded: cfg, strength"
+    assert client.writes == [("cfg", 7.5), ("strength", 0.6)]
+
+
+class BatchingClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def write_many(self, pairs):
+        self.batches.append(list(pairs))
+
+
+def test_handle_message_batches_writes_when_supported():
+    client = BatchingClient()
+    result = handle_message(client, b'{"payload": {"cfg": 7.5, "strength": 0.6}}')
+    assert result == "forwarded: cfg, strength"
+    assert client.batches == [[("cfg", 7.5), ("strength", 0.6)]]
+    assert client.writes == []
+
+
+def test_handle_message_rejects_invalid_json():
+    client = FakeClient()
+    assert handle_message(client, b"{not json").startswith("invalid json")
+    assert client.writes == []
+
+
+def test_handle_message_rejects_non_dict_payload():
+    client = FakeClient()
+    assert handle_message(client, b'{"payload": [1, 2]}') == "payload not a dict"
+    assert handle_message(client, b'{"controlType": "liveParam"}') == "no payload"
+    assert client.writes == []
+
+
+def test_handle_message_rejects_empty_and_non_object_bodies():
+    client = FakeClient()
+    assert handle_message(client, b"") == "invalid json: empty or not an object"
+    assert handle_message(client, b"  [1, 2]") == "invalid json: empty or not an object"
+    assert client.writes == []
+
+
+def test_handle_batch_merges_payloads_newest_value_wins():
+    client = BatchingClient()
+    bodies = [
+        b'{"payload": {"cfg": 7.0, "strength": 0.6}}',
+        b"",
+        b'{"payload": {"cfg": 8.5}}',
+    ]
+    assert handle_batch(client, bodies) == "forwarded 2/3 messages: cfg, strength"
+    assert client.batches == [[("cfg", 8.5), ("strength", 0.6)]]
+
+
+class FakeChannel:
+    def __init__(self):
+        self.acks = []
+        self.nacks = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, multiple=False, requeue=True):
+        self.nacks.append((delivery_tag, requeue))
+
+
+def test_ack_batcher_acks_once_per_batch():
+    channel = FakeChannel()
+    acks = AckBatcher(channel, batch_size=3)
+    acks.ack(1)
+    acks.ack(2)
+    assert channel.acks == []
+    acks.ack(3)
+    assert channel.acks == [(3, True)]
+    acks.ack(4)
+    acks.flush()
+    acks.flush()
+    assert channel.acks == [(3, True), (4, True)]
+
+
+def test_ack_batcher_flushes_before_nack():
+    channel = FakeChannel()
+    acks = AckBatcher(channel, batch_size=10)
+    acks.ack(1)
+    acks.nack(2, requeue=True)
+    assert channel.acks == [(1, True)]
+    assert channel.nacks == [(2, True)]
+
+
+class FailingClient(FakeClient):
+    def write_many(self, pairs):
+        raise ConnectionError("mediator down")
+
+
+def test_process_batch_nacks_and_requeues_when_mediator_write_fails():
+    channel = FakeChannel()
+    acks = AckBatcher(channel, batch_size=1)
+    method = SimpleNamespace(delivery_tag=7, redelivered=False)
+    process_batch(FailingClient(), acks, method, [b'{"payload": {"cfg": 7.5}}'])
+    assert channel.nacks == [(7, True)]
+    assert channel.acks == []
+
+
+def test_process_batch_acks_batches_without_valid_payloads():
+    channel = FakeChannel()
+    acks = AckBatcher(channel, batch_size=1)
+    process_batch(FailingClient(), acks, SimpleNamespace(delivery_tag=3, redelivered=False), [b"{not json"])
+    assert channel.acks == [(3, True)]
+    assert channel.nacks == []
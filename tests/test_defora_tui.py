@@ -1,7 +1,9 @@
 import curses
+import time
+
 import pytest
 
-from defora_cli.defora_tui import DeforaTUI, Param, center_text
+from defora_cli.defora_tui import DeforaTUI, DeforumBridge, MediatorWorker, Param, center_text
 
 
 class FakeWin:
@@ -11,6 +13,7 @@ class FakeWin:
         self.calls = []
         self.inputs = list(inputs or [])
         self.nodelay_flag = None
+        self.timeout_ms = None
 
     def getmaxyx(self):
         return (self.h, self.w)
@@ -24,9 +27,18 @@ class FakeWin:
     def refresh(self):
         pass
 
+    def noutrefresh(self):
+        pass
+
+    def clrtoeol(self):
+        pass
+
     def nodelay(self, flag):
         self.nodelay_flag = flag
 
+    def timeout(self, ms):
+        self.timeout_ms = ms
+
     def getch(self):
         if self.inputs:
             return self.inputs.pop(0)
@@ -118,6 +130,16 @@ def test_draw_slider_renders_fill_and_attr():
     assert fake.calls[-1][3] == curses.A_REVERSE
 
 
+def test_draw_slider_line_width_does_not_depend_on_value():
+    fake = FakeWin()
+    ui = DeforaTUI(fake)
+    widths = set()
+    for value in (-180.0, -100.0, -99.0, 0.0, 5.0, 180.0):
+        ui.draw_slider(5, "Rotate Y", Param("Rotate Y", value, min_value=-180, max_value=180))
+        widths.add(len(fake.calls[-1][2]))
+    assert len(widths) == 1
+
+
 def test_param_navigation_wraps_and_clamps_status():
     fake = FakeWin()
     ui = DeforaTUI(fake)
@@ -191,12 +213,62 @@ def test_run_handles_navigation_and_sources(monkeypatch):
 
     ui.run()
 
-    assert fake.nodelay_flag is False
+    assert fake.timeout_ms == 33
     assert ui.tab == 1
     assert ui.params["cfg"].value == pytest.approx(6.0)
     assert ui.params["cfg"].source == "Beat"
 
 
+def test_draw_only_clears_on_layout_change_and_skips_unchanged_sliders():
+    fake = FakeWin()
+    ui = DeforaTUI(fake)
+    ui.draw()
+    ui.selected_param = "strength"
+    ui.params["strength"].value = 1.0
+    fake.calls.append(("sentinel",))
+    ui.draw()
+
+    assert ("sentinel",) in fake.calls  # no erase between frames on the same tab
+    redrawn = [c for c in fake.calls[fake.calls.index(("sentinel",)):] if len(c) == 4 and "[" in c[2]]
+    labels = {c[2].split()[0] for c in redrawn if c[0] in range(24, 30)}
+    assert labels == {"Vibe", "Strength"}  # previously and newly selected rows only
+
+    ui.tab = 2
+    ui.draw()
+    assert ("sentinel",) not in fake.calls
+
+
+def test_run_skips_redraw_for_unmapped_keys(monkeypatch):
+    fake = FakeWin(inputs=[ord("z"), -1, -1, curses.KEY_RIGHT, ord("q")])
+    ui = DeforaTUI(fake, mediator=FakeMediator(values={}))
+    monkeypatch.setattr(curses, "curs_set", lambda *_: None)
+    draws = []
+    original = ui.draw
+    ui.draw = lambda: (draws.append(1), original())  # type: ignore[assignment]
+
+    ui.run()
+
+    assert len(draws) == 2  # initial frame + the KEY_RIGHT adjustment
+
+
+def test_handle_key_routes_sub_tab_keys_before_global_keys():
+    ui = DeforaTUI(FakeWin())
+    ui.tab = 1
+    ui.handle_key(ord("p"))
+    assert ui.prompts_sub_tab == 1
+
+    ui.handle_key(ord("."))
+    assert ui.lora_crossfader.value == pytest.approx(0.55)
+    ui.handle_key(curses.KEY_RIGHT)
+    assert ui.lora_a[0][1].value == pytest.approx(0.05)
+    assert ui.params["cfg"].value == pytest.approx(6.0)
+
+    ui.handle_key(curses.KEY_F1)
+    assert ui.tab == 0
+    ui.handle_key(curses.KEY_RIGHT)
+    assert ui.params["cfg"].value == pytest.approx(6.5)
+
+
 def test_connect_syncs_params_and_frames():
     fake = FakeWin()
     mediator = FakeMediator()
@@ -210,6 +282,32 @@ def test_connect_syncs_params_and_frames():
     assert ("should_use_deforumation_cfg", 1) in mediator.writes
 
 
+class BatchingMediator(FakeMediator):
+    def __init__(self, values=None):
+        super().__init__(values)
+        self.batches = []
+
+    def read_many(self, keys):
+        self.batches.append(("read", list(keys)))
+        return [self.values.get(k) for k in keys]
+
+    def write_many(self, pairs):
+        pairs = list(pairs)
+        self.batches.append(("write", pairs))
+        self.writes.extend(pairs)
+
+
+def test_connect_batches_flag_writes_and_param_reads():
+    mediator = BatchingMediator()
+    ui = DeforaTUI(FakeWin(), mediator=mediator)
+    ui.connect_and_sync()
+
+    kinds = [kind for kind, _ in mediator.batches]
+    assert kinds == ["write", "read"]
+    assert len(mediator.batches[1][1]) == len(ui.params)
+    assert ui.params["fov"].value == pytest.approx(80.0)
+
+
 def test_frame_timeline_and_generation():
     fake = FakeWin()
     mediator = FakeMediator()
@@ -269,6 +367,140 @@ def test_adjust_selected_writes_to_mediator():
     mediator.writes.clear()
     ui.selected_param = "zoom"
     ui.adjust_selected(ui.params["zoom"].step)
+    ui.adjust_selected(ui.params["zoom"].step)
+    assert mediator.writes == []  # debounced until the frame flush
+    ui.flush_param_writes()
+    assert len(mediator.writes) == 1
     write_keys = [w[0] for w in mediator.writes]
     assert "translation_z" in write_keys
     assert any(abs(val - ui.params["zoom"].value) < 1e-6 for key, val in mediator.writes if key == "translation_z")
+
+
+def test_mediator_worker_forwards_writes_and_polls_frames():
+    mediator = FakeMediator()
+    bridge = DeforumBridge("h", "p", mediator)
+    assert bridge.connect()
+    mediator.writes.clear()
+    worker = MediatorWorker(bridge, poll_interval=0.01)
+    worker.start()
+    worker.write("zoom", 2.5)
+    deadline = time.time() + 2
+    while worker.snapshot()["frames_total"] is None and time.time() < deadline:
+        time.sleep(0.01)
+    worker.stop()
+
+    assert ("translation_z", 2.5) in mediator.writes
+    assert worker.snapshot()["frames_total"] == 5
+    assert not worker.is_alive()
+
+
+class FakePad:
+    def __init__(self, rows, cols):
+        self.rows, self.cols = rows, cols
+        self.cells = {}
+        self.staged = []
+
+    def getmaxyx(self):
+        return (self.rows, self.cols)
+
+    def addstr(self, y, x, text, attr=0):
+        self.cells[(y, x)] = text
+
+    def noutrefresh(self, *args):
+        self.staged.append(args)
+
+
+def test_timeline_uses_scrolling_pad_when_available(monkeypatch):
+    pads = []
+    monkeypatch.setattr(curses, "newpad", lambda r, c: pads.append(FakePad(r, c)) or pads[-1])
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    fake = FakeWin()
+    ui = DeforaTUI(fake, mediator=FakeMediator())
+    ui.connect_and_sync()
+    ui.frames_total, ui.frame_cursor = 40, 20
+    ui.draw()
+
+    timeline = next(p for p in pads if p.rows == 1)
+    assert timeline.cells[(0, 20 * 7)] == "[0020]"
+    assert timeline.cells[(0, 19 * 7)] == " 0019 "
+    (_, pcol, y, x, _, x1), = timeline.staged
+    assert y == 19 and pcol <= 20 * 7 <= pcol + (x1 - x)
+    assert any(c[0] == 19 and c[2].startswith("Frames 21/40: ") for c in fake.calls)
+
+    ui.frame_cursor = 21
+    ui.draw()
+    assert timeline.cells[(0, 20 * 7)] == " 0020 "
+    assert timeline.cells[(0, 21 * 7)] == "[0021]"
+
+
+def test_mediator_worker_coalesces_queued_writes():
+    mediator = BatchingMediator()
+    bridge = DeforumBridge("h", "p", mediator)
+    assert bridge.connect()
+    mediator.batches.clear()
+    worker = MediatorWorker(bridge, poll_interval=5)
+    for value in (1.0, 1.5, 2.0):
+        worker.write("zoom", value)
+    worker.write("cfg", 9.0)
+    worker.start()
+    worker.stop()
+
+    assert mediator.batches == [("write", [("translation_z", 2.0), ("cfg", 9.0)])]
+
+
+def test_draw_brackets_frame_with_synchronized_output(capsys):
+    ui = DeforaTUI(FakeWin())
+    ui._sync_output = True
+    ui.draw()
+    assert capsys.readouterr().out == "\x1b[?2026h\x1b[?2026l"
+
+    ui._sync_output = False
+    ui.draw()
+    assert capsys.readouterr().out == ""
+
+
+def test_static_panels_are_drawn_once_per_layout():
+    fake = FakeWin()
+    ui = DeforaTUI(fake)
+    ui.tab = 3
+    ui.draw()
+    assert any("LFO MODULATORS" in c[2] for c in fake.calls)
+    fake.calls.clear()
+    ui.draw()
+    assert not any("LFO MODULATORS" in c[2] for c in fake.calls)
+    assert any(c[0] == 0 for c in fake.calls)  # header still refreshed
+
+    ui.tab = 1
+    ui.prompts_sub_tab = 1  # LoRA panel shows live values
+    ui.draw()
+    fake.calls.clear()
+    ui.draw()
+    assert any("Crossfader" in c[2] for c in fake.calls)
+
+
+def test_layout_is_recomputed_on_resize():
+    fake = FakeWin(h=40, w=100)
+    ui = DeforaTUI(fake)
+    assert (ui._layout.col2, ui._layout.col3, ui._layout.preview_w) == (40, 70, 58)
+    fake.h, fake.w = 50, 200
+    assert ui._layout.w == 100  # unchanged until curses reports the resize
+    ui.handle_key(curses.KEY_RESIZE)
+    assert (ui._layout.h, ui._layout.w, ui._layout.col2) == (50, 200, 80)
+    assert ui._dirty
+
+
+def test_param_adjust_clamps_to_both_bounds():
+    p = Param("Zoom", 0.0, min_value=-1.0, max_value=1.0)
+    p.adjust(5.0)
+    assert p.value == 1.0
+    p.adjust(-5.0)
+    assert p.value == -1.0
+    p.adjust(0.25)
+    assert p.value == -0.75
+
+
+def test_hot_objects_have_no_instance_dict():
+    from defora_cli.defora_tui import SafeWindow
+
+    for obj in (Param("x", 0.0), SafeWindow(FakeWin()), DeforumBridge("h", "p", FakeMediator())):
+        assert type(obj).__dictoffset__ == 0  # hasattr would hit SafeWindow.__getattr__
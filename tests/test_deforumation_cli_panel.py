@@ -5,6 +5,7 @@ from pathlib import Path
 
 from defora_cli.deforumation_cli_panel import (
     ControlBinding,
+    DeforumControlPanel,
     key_to_label,
     normalize_label,
     default_bindings,
@@ -158,5 +159,165 @@ def test_control_binding_parameter_ranges():
             assert binding["min"] < binding["max"], f"Min should be less than max for {binding['param']}"
 
 
+def test_panel_reuses_injected_mediator_for_updates():
+    mediator = FakeMediatorClient()
+    ctrl = ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5, min_value=0.0, max_value=30.0)
+    panel = DeforumControlPanel(None, "h", "1", [ctrl], mediator=mediator)
+
+    panel.refresh_values()
+    panel.update_control(ctrl, 0.5)
+    panel.update_control(ctrl, 0.5)
+
+    assert ctrl.value == 8.0
+    assert mediator.writes == [("cfg", 7.5), ("cfg", 8.0)]
+
+
+class BatchingMediatorClient(FakeMediatorClient):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def read_many(self, keys):
+        self.batches.append(("read", list(keys)))
+        return [self.values.get(key, 0.0) for key in keys]
+
+    def write_many(self, pairs):
+        self.batches.append(("write", list(pairs)))
+        self.values.update(pairs)
+
+
+def test_bootstrap_and_refresh_use_one_batch_each():
+    mediator = BatchingMediatorClient()
+    controls = [
+        ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5),
+        ControlBinding(id="noise", label="Noise", param="noise_multiplier", step=0.05),
+    ]
+    panel = DeforumControlPanel(None, "h", "1", controls, mediator=mediator)
+
+    panel.bootstrap_flags()
+    panel.refresh_values()
+
+    assert [kind for kind, _ in mediator.batches] == ["write", "read"]
+    assert len(mediator.batches[0][1]) == 9
+    assert mediator.batches[1][1] == ["cfg", "noise_multiplier"]
+    assert [c.value for c in controls] == [7.0, 1.0]
+    assert mediator.writes == []  # nothing fell back to per-key calls
+
+
+def test_hotkeys_dispatch_through_prebuilt_table():
+    mediator = FakeMediatorClient()
+    cfg = ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5, inc_keys=["."], dec_keys=[","], value=7.0)
+    zoom = ControlBinding(id="z", label="Zoom", param="translation_z", step=0.05, inc_keys=["E"], dec_keys=["."])
+    panel = DeforumControlPanel(None, "h", "1", [cfg, zoom], mediator=mediator)
+
+    panel.handle_binding_input(".")  # first binding of a shared key wins
+    panel.handle_binding_input("e")
+    panel.handle_binding_input("x")
+
+    assert mediator.writes == [("cfg", 7.5), ("translation_z", 0.05)]
+
+    zoom.inc_keys, zoom.dec_keys = ["x"], ["y"]
+    panel._build_hotkeys()
+    panel.handle_binding_input("x")
+    assert mediator.writes[-1] == ("translation_z", 0.1)
+
+
+class FakeScreen:
+    def __init__(self, inputs):
+        self.inputs = list(inputs)
+        self.refreshes = 0
+
+    def getmaxyx(self):
+        return (24, 100)
+
+    def nodelay(self, flag):
+        pass
+
+    def timeout(self, ms):
+        pass
+
+    def erase(self):
+        pass
+
+    def addnstr(self, *args):
+        pass
+
+    def hline(self, *args):
+        pass
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def getch(self):
+        return self.inputs.pop(0)
+
+
+def test_run_redraws_only_after_changes(monkeypatch):
+    monkeypatch.setattr(curses, "curs_set", lambda *_: None)
+    monkeypatch.setattr(curses, "keyname", lambda key: bytes([key]))
+    screen = FakeScreen([-1, -1, ord("z"), curses.KEY_DOWN, -1, ord("q")])
+    controls = [
+        ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5),
+        ControlBinding(id="noise", label="Noise", param="noise_multiplier", step=0.05),
+    ]
+    panel = DeforumControlPanel(screen, "h", "1", controls, mediator=FakeMediatorClient())
+
+    panel.run()
+
+    assert screen.refreshes == 2  # initial frame + the selection move
+
+
+def test_control_lines_are_cached_until_value_selection_or_binding_changes():
+    ctrl = ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5, inc_keys=["."], dec_keys=[","], value=7.0)
+    panel = DeforumControlPanel(None, "h", "1", [ctrl], mediator=FakeMediatorClient())
+
+    line = panel._control_line(ctrl, True)
+    assert line.startswith("> CFG") and "[, | ." in line
+    assert panel._control_line(ctrl, True) is line
+
+    ctrl.value = 7.5
+    assert "7.50" in panel._control_line(ctrl, True)
+    assert panel._control_line(ctrl, False).startswith("  CFG")
+
+    ctrl.inc_keys = ["x"]
+    panel._build_hotkeys()
+    assert "[, | x" in panel._control_line(ctrl, False)
+
+
+def test_cli_config_roundtrip(tmp_path):
+    from defora_cli.deforumation_cli_panel import build_controls, load_cli_config, save_cli_config
+
+    path = tmp_path / "bindings.json"
+    mediator_cfg, controls = build_controls(load_cli_config(path))  # writes defaults on first use
+    assert path.exists()
+    controls[0].inc_keys = ["x"]
+    save_cli_config(path, mediator_cfg, controls)
+
+    reloaded_cfg, reloaded = build_controls(load_cli_config(path))
+    assert reloaded_cfg == mediator_cfg
+    assert reloaded[0].inc_keys == ["x"]
+    assert [c.param for c in reloaded] == [c.param for c in controls]
+
+
+def test_control_binding_is_slotted():
+    ctrl = ControlBinding(id="cfg", label="CFG", param="cfg", step=0.5)
+    assert not hasattr(ctrl, "__dict__")
+    with pytest.raises(AttributeError):
+        ctrl.unknown = 1
+
+
+def test_update_control_skips_writes_at_limits():
+    mediator = FakeMediatorClient()
+    ctrl = ControlBinding(id="s", label="Strength", param="strength", step=0.5, min_value=0.0, max_value=1.0, value=0.75)
+    panel = DeforumControlPanel(None, "h", "1", [ctrl], mediator=mediator)
+
+    panel.update_control(ctrl, 0.5)
+    panel.update_control(ctrl, 0.5)
+    panel.update_control(ctrl, 0.5)
+
+    assert mediator.writes == [("strength", 1.0)]
+    assert panel.status == "Strength at limit (1.00)"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
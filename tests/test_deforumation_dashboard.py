@@ -1,16 +1,22 @@
+import subprocess
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from defora_cli.deforumation_dashboard import (
     DashboardState,
     _parse_value,
+    edit_field,
     ensure_defaults,
+    load_config,
     load_preset,
+    poll_audio_helper,
     save_preset,
     run_audio_helper,
+    save_config,
     send_to_mediator,
+    stop_audio_helper,
     toggle_field,
 )
 
@@ -26,6 +32,15 @@ class TestDeforumationDashboard(unittest.TestCase):
         self.assertEqual(_parse_value("0", int), 0)
         self.assertAlmostEqual(_parse_value("0.5", float), 0.5)
 
+    def test_tab_bars_are_prebuilt_per_tab(self):
+        from defora_cli.deforumation_dashboard import _TAB_BARS, _TAB_INDEX, _TAB_NAMES, TAB_FIELDS
+
+        self.assertEqual(_TAB_NAMES, tuple(TAB_FIELDS))
+        self.assertEqual(_TAB_INDEX[_TAB_NAMES[2]], 2)
+        bar = _TAB_BARS["MOTIONS"]
+        self.assertIn("[MOTIONS]", bar)
+        self.assertTrue(bar.startswith(" PROMPTS  | "))
+
     def test_toggle_field(self):
         self.assertFalse(toggle_field(True))
         self.assertEqual(toggle_field(1), 0)
@@ -54,6 +69,47 @@ class TestDeforumationDashboard(unittest.TestCase):
         self.assertIn(("strength", 0.5), sent)
         self.assertIn(("cfg", 7.0), sent)
 
+    def test_send_to_mediator_batches_on_one_client(self):
+        created = []
+
+        class BatchClient:
+            def __init__(self, host, port):
+                created.append(self)
+                self.batches = []
+
+            def write_many(self, pairs):
+                self.batches.append(list(pairs))
+
+        state = DashboardState(
+            config_path=Path("x"),
+            mediator_host="h",
+            mediator_port="p",
+            data={"strength": 0.5, "cfg": 7.0},
+        )
+        with patch("defora_cli.deforumation_dashboard.MediatorClient", BatchClient):
+            send_to_mediator(state, ["strength", "missing", "cfg"])
+            msg = send_to_mediator(state, ["cfg"])
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0].batches, [[("strength", 0.5), ("cfg", 7.0)], [("cfg", 7.0)]])
+        self.assertEqual(msg, "Sent to mediator: cfg")
+
+    def test_sendable_keys_are_cached_per_tab(self):
+        from defora_cli.deforumation_dashboard import TAB_MOTIONS, sendable_keys
+
+        state = DashboardState(
+            config_path=Path("x"),
+            mediator_host="h",
+            mediator_port="p",
+            data={"translation_x": 1.0, "fov": 70},
+            tab=TAB_MOTIONS,
+        )
+        keys = sendable_keys(state)
+        self.assertEqual(keys, ["translation_x", "fov"])
+        self.assertIs(sendable_keys(state), keys)
+        state.data["rotation_z"] = 5.0
+        state.sendable_cache.clear()
+        self.assertEqual(sendable_keys(state), ["translation_x", "rotation_z", "fov"])
+
     def test_run_audio_helper_invokes_subprocess(self):
         state = DashboardState(
             config_path=Path("x"),
@@ -67,15 +123,64 @@ class TestDeforumationDashboard(unittest.TestCase):
                 "audio_live": False,
             },
         )
-        with patch("defora_cli.deforumation_dashboard.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
+        with patch("defora_cli.deforumation_dashboard.subprocess.Popen") as mock_popen:
+            mock_popen.return_value.stderr = iter(["loading audio\n"])
+            mock_popen.return_value.poll.return_value = None
             msg = run_audio_helper(state)
-        self.assertIn("finished", msg)
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+            self.assertEqual(run_audio_helper(state), "Audio helper already running.")
+        self.assertIn("started", msg)
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
         self.assertEqual(args[0], sys.executable)
         self.assertEqual(args[1:4], ["-m", "defora_cli.audio_reactive_modulator", "--audio"])
 
+        self.assertFalse(poll_audio_helper(state))
+        mock_popen.return_value.poll.return_value = 0
+        self.assertTrue(poll_audio_helper(state))
+        self.assertEqual(state.status, "Audio helper finished.")
+        self.assertIsNone(state.audio_proc)
+
+    def test_poll_audio_helper_reports_final_stderr_line(self):
+        state = DashboardState(config_path=Path("x"), mediator_host="h", mediator_port="p")
+        state.audio_proc = MagicMock()
+        state.audio_proc.poll.return_value = 1
+        state.audio_pump = MagicMock()
+        state.audio_pump.join.side_effect = lambda timeout: setattr(state, "audio_last_line", "bad mapping")
+        self.assertTrue(poll_audio_helper(state))
+        self.assertEqual(state.status, "Audio helper failed (1): bad mapping")
+        self.assertIsNone(state.audio_pump)
+
+    def test_stop_audio_helper_kills_after_timeout(self):
+        state = DashboardState(config_path=Path("x"), mediator_host="h", mediator_port="p")
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.wait.side_effect = [subprocess.TimeoutExpired("audio", 2.0), 0]
+        state.audio_proc = proc
+        stop_audio_helper(state)
+        proc.terminate.assert_called_once()
+        proc.kill.assert_called_once()
+        self.assertIsNone(state.audio_proc)
+
+    def test_edit_field_blocks_even_when_loop_polls(self):
+        class FakeScreen:
+            delay = 200  # left over from the audio-helper poll
+
+            def timeout(self, delay):
+                self.delay = delay
+
+            def addstr(self, text):
+                pass
+
+            def clrtoeol(self):
+                pass
+
+            def getstr(self):
+                return b"" if self.delay >= 0 else b"8.5"
+
+        with patch("defora_cli.deforumation_dashboard.curses.echo"), \
+                patch("defora_cli.deforumation_dashboard.curses.noecho"):
+            self.assertEqual(edit_field(FakeScreen(), "CFG", 7.5, float), 8.5)
+
     def test_run_audio_helper_missing_mapping(self):
         state = DashboardState(
             config_path=Path("x"),
@@ -92,6 +197,22 @@ class TestDeforumationDashboard(unittest.TestCase):
         msg = run_audio_helper(state)
         self.assertIn("Mapping file not found", msg)
 
+    def test_config_roundtrip_matches_stdlib_json(self):
+        import json
+        import math
+        import tempfile
+
+        data = {"cfg": float("nan"), "strength": float("inf"), 1: "first", "positive_prompt": "café"}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            save_config(path, data)
+            self.assertEqual(path.read_text(encoding="utf-8"), json.dumps(data, indent=2))
+            loaded = load_config(path)
+        self.assertTrue(math.isnan(loaded["cfg"]))
+        self.assertEqual(loaded["strength"], float("inf"))
+        self.assertEqual(loaded["1"], "first")
+        self.assertEqual(loaded["positive_prompt"], "café")
+
     def test_preset_roundtrip(self, tmp_path: Path = None):
         name = "testpreset_dashboard"
         data = {"positive_prompt": "hi", "cfg": 7}
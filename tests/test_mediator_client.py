@@ -9,6 +9,8 @@ class FakeWebSocket:
     def __init__(self):
         self.sent = []
         self.to_return = pickle.dumps(["ok"])
+        self.entered = 0
+        self.exited = 0
 
     async def send(self, payload):
         self.sent.append(pickle.loads(payload))
@@ -17,9 +19,11 @@ class FakeWebSocket:
         return self.to_return
 
     async def __aenter__(self):
+        self.entered += 1
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
+        self.exited += 1
         return False
 
 
@@ -43,6 +47,181 @@ class TestMediatorClient(unittest.TestCase):
         client.write("strength", 0.5)
         self.assertEqual(sock.sent[-1], [1, "strength", 0.5])
 
+    def test_connect_timeout_bounds_the_handshake(self):
+        class SlowConnect(FakeWebSocket):
+            async def __aenter__(self):
+                await asyncio.sleep(1)
+                return self
+
+        client = MediatorClient("localhost", "8766", connector=lambda uri: SlowConnect(), connect_timeout=0.01)
+        self.assertEqual(client.timeout, 10.0)
+        with self.assertRaises(asyncio.TimeoutError):
+            client.read("cfg")
+
+    def test_write_many_pipelines_on_one_connection(self):
+        sock = FakeWebSocket()
+        opened = []
+
+        def connector(uri):
+            opened.append(uri)
+            return sock
+
+        client = MediatorClient("localhost", "8766", connector=connector)
+        replies = client.write_many([("cfg", 7.0), ("strength", 0.4)])
+        self.assertEqual(replies, ["ok", "ok"])
+        self.assertEqual(sock.sent, [[1, "cfg", 7.0], [1, "strength", 0.4]])
+        self.assertEqual(client.read_many(["cfg"]), ["ok"])
+        self.assertEqual(len(opened), 1)
+        self.assertEqual(client.write_many([]), [])
+
+    def test_connection_is_reused_across_calls(self):
+        sock = FakeWebSocket()
+        opened = []
+
+        def connector(uri):
+            opened.append(uri)
+            return sock
+
+        client = MediatorClient("localhost", "8766", connector=connector)
+        self.assertEqual(opened, [])
+        client.ensure_connected()
+        client.write("cfg", 7.0)
+        client.read("cfg")
+        self.assertEqual(opened, ["ws://localhost:8766"])
+        self.assertEqual(len(sock.sent), 2)
+        client.close()
+        self.assertEqual(sock.exited, 1)
+
+    def test_reconnects_when_reused_connection_is_stale(self):
+        stale = FakeWebSocket()
+        fresh = FakeWebSocket()
+        socks = [stale, fresh]
+
+        async def broken_send(payload):
+            raise ConnectionError("closed")
+
+        client = MediatorClient("localhost", "8766", connector=lambda uri: socks.pop(0))
+        client.ensure_connected()
+        stale.send = broken_send
+        client.write("strength", 0.25)
+        self.assertEqual(stale.exited, 1)
+        self.assertEqual(fresh.sent, [[1, "strength", 0.25]])
+
+    def test_json_protocol_is_opt_in(self):
+        class JsonSocket(FakeWebSocket):
+            async def send(self, payload):
+                self.sent.append(payload)
+
+            async def recv(self):
+                return b"[0.5]"
+
+        sock = JsonSocket()
+        client = MediatorClient("localhost", "8766", connector=lambda uri: sock, protocol="json")
+        self.assertEqual(client.read("strength"), 0.5)
+        self.assertEqual(sock.sent, [b'[0,"strength",0]'])
+        self.assertEqual(MediatorClient("localhost", "8766", connector=fake_connector).protocol, "pickle")
+        with self.assertRaises(ValueError):
+            MediatorClient("localhost", "8766", connector=fake_connector, protocol="xml")
+
+    def test_pickle_frames_use_protocol_5(self):
+        class RawSocket(FakeWebSocket):
+            async def send(self, payload):
+                self.sent.append(payload)
+
+        sock = RawSocket()
+        MediatorClient("localhost", "8766", connector=lambda uri: sock).read("cfg")
+        self.assertEqual(sock.sent[0][:2], b"\x80\x05")
+
+    def test_msgpack_protocol_roundtrip(self):
+        from defora_cli.mediator_client import CODECS
+
+        if "msgpack" not in CODECS:
+            self.skipTest("msgpack not installed")
+        import msgpack
+
+        class MsgpackSocket(FakeWebSocket):
+            async def send(self, payload):
+                self.sent.append(msgpack.unpackb(payload, raw=False))
+
+            async def recv(self):
+                return msgpack.packb(["cfg", 7.0], use_bin_type=True)
+
+        sock = MsgpackSocket()
+        client = MediatorClient("localhost", "8766", connector=lambda uri: sock, protocol="msgpack")
+        self.assertEqual(client.write("cfg", 7.0), ["cfg", 7.0])
+        self.assertEqual(sock.sent, [[1, "cfg", 7.0]])
+
+    def test_subscribe_receives_pushed_changes_from_mediator_server(self):
+        try:
+            import websockets
+        except ImportError:
+            self.skipTest("websockets not installed")
+        from defora_cli import mediator_server
+
+        async def scenario():
+            async with websockets.serve(lambda ws: mediator_server.handle_connection(ws, "test"), "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                client = MediatorClient("127.0.0.1", port)
+                pushes = client.subscribe(["cfg"])
+                self.assertEqual(await pushes.__anext__(), ("cfg", mediator_server.STATE["cfg"]))
+                async with websockets.connect(f"ws://127.0.0.1:{port}") as writer:
+                    for value in (3.0, 3.0, 4.0):
+                        await writer.send(pickle.dumps([1, "cfg", value]))
+                        await writer.recv()
+                self.assertEqual(await asyncio.wait_for(pushes.__anext__(), 1), ("cfg", 3.0))
+                self.assertEqual(await asyncio.wait_for(pushes.__anext__(), 1), ("cfg", 4.0))
+                await pushes.aclose()
+
+        saved = dict(mediator_server.STATE)
+        try:
+            asyncio.run(scenario())
+        finally:
+            mediator_server.STATE.clear()
+            mediator_server.STATE.update(saved)
+
+    def test_mediator_server_subscribe_accepts_a_bare_param_name(self):
+        try:
+            import websockets
+        except ImportError:
+            self.skipTest("websockets not installed")
+        from defora_cli import mediator_server
+
+        async def scenario():
+            async with websockets.serve(lambda ws: mediator_server.handle_connection(ws, "test"), "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                async with websockets.connect(f"ws://127.0.0.1:{port}") as ws:
+                    await ws.send(pickle.dumps([3, "strength", 0]))
+                    return pickle.loads(await asyncio.wait_for(ws.recv(), 1))
+
+        self.assertEqual(asyncio.run(scenario()), ["strength", mediator_server.STATE["strength"]])
+
+    def test_mediator_server_rejects_oversized_and_non_builtin_pickles(self):
+        try:
+            import websockets
+        except ImportError:
+            self.skipTest("websockets not installed")
+        from pathlib import PurePosixPath
+
+        from defora_cli import mediator_server
+
+        async def scenario():
+            async with websockets.serve(lambda ws: mediator_server.handle_connection(ws, "test"), "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                async with websockets.connect(f"ws://127.0.0.1:{port}") as ws:
+                    await ws.send(pickle.dumps([0, PurePosixPath("cfg"), 0]))
+                    blocked = pickle.loads(await ws.recv())
+                    await ws.send(pickle.dumps([1, "cfg", "x" * mediator_server.MAX_MESSAGE_BYTES]))
+                    too_big = pickle.loads(await ws.recv())
+                    await ws.send(pickle.dumps([0, "cfg", 0]))
+                    value = pickle.loads(await ws.recv())
+                return blocked, too_big, value
+
+        blocked, too_big, value = asyncio.run(scenario())
+        self.assertEqual(blocked[0], "error")
+        self.assertIn("blocked", blocked[1])
+        self.assertEqual(too_big[0], "error")
+        self.assertEqual(value, [mediator_server.STATE["cfg"]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,10 +3,104 @@ import os
 from pathlib import Path
 import unittest
 
-from defora_cli.monitor_cli import detect_frames_dir, format_live_display
+from defora_cli.monitor_cli import (
+    LIVE_KEYS,
+    FrameWatcher,
+    LiveDisplay,
+    ascii_from_image,
+    detect_frames_dir,
+    fetch_live_values,
+    format_live_display,
+    latest_frame,
+)
 
 
 class TestMonitorCli(unittest.TestCase):
+    def test_ascii_from_image_maps_gray_levels_to_ramp(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            self.skipTest("Pillow not installed")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "frame.png"
+            img = Image.new("L", (3, 2))
+            img.putdata([0, 128, 255, 255, 0, 29])
+            img.save(path)
+            self.assertEqual(ascii_from_image(path, width=3, height=2), "@+ \n @%")
+
+    def test_latest_frame_picks_highest_png_name(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            self.assertIsNone(latest_frame(path))
+            for name in ("frame_00002.png", "frame_00010.png", "frame_00009.png", "notes.txt", ".frame_99999.png"):
+                (path / name).write_bytes(b"")
+            self.assertEqual(latest_frame(path), path / "frame_00010.png")
+
+    def test_frame_watcher_rescans_only_when_directory_changes(self):
+        from unittest import mock
+
+        from defora_cli import monitor_cli
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            (path / "frame_00001.png").write_bytes(b"")
+            os.utime(path, ns=(1, 1))
+            watcher = FrameWatcher(path)
+            with mock.patch.object(monitor_cli, "latest_frame", wraps=latest_frame) as scan:
+                self.assertEqual(watcher.latest(), path / "frame_00001.png")
+                self.assertEqual(watcher.latest(), path / "frame_00001.png")
+                self.assertEqual(scan.call_count, 1)
+                (path / "frame_00002.png").write_bytes(b"")
+                os.utime(path, ns=(2, 2))
+                self.assertEqual(watcher.latest(), path / "frame_00002.png")
+                self.assertEqual(scan.call_count, 2)
+
+    def test_live_display_rewrites_only_changed_rows(self):
+        display = LiveDisplay()
+        values = {key: 0.0 for key in LIVE_KEYS}
+        first = display.render(values, values)
+        self.assertTrue(first.startswith("\033[2J\033[H"))
+        screen = first[len("\033[2J\033[H"):].split("\n")
+        self.assertEqual(display.render(values, values), "")
+
+        changed = dict(values, cfg=1.5)
+        update = display.render(changed, values)
+        row = screen.index("  cfg             :   0.000") + 1
+        self.assertTrue(update.startswith(f"\033[{row};1H\033[K  cfg             :   1.500 ↑ 1.500"))
+        self.assertNotIn("strength", update)
+
+    def test_fetch_live_values_reads_all_keys_in_one_batch(self):
+        import asyncio
+
+        class BatchClient:
+            def __init__(self):
+                self.batches = []
+
+            def read_many(self, keys):
+                self.batches.append(list(keys))
+                return [1.0] * len(keys)
+
+            def read(self, key):
+                raise AssertionError("per-key read used")
+
+        client = BatchClient()
+        values = asyncio.run(fetch_live_values(client))
+        self.assertEqual(client.batches, [list(LIVE_KEYS)])
+        self.assertEqual(values["fov"], 1.0)
+
+    def test_fetch_live_values_falls_back_to_per_key_reads(self):
+        import asyncio
+
+        class LegacyClient:
+            def read(self, key):
+                if key == "fov":
+                    raise ConnectionError("down")
+                return 0.5
+
+        values = asyncio.run(fetch_live_values(LegacyClient()))
+        self.assertEqual(values["cfg"], 0.5)
+        self.assertEqual(values["fov"], "?")
+
     def test_detect_frames_dir_env(self):
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp)
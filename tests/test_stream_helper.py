@@ -1,7 +1,7 @@
 import unittest
 from pathlib import Path
 
-from defora_cli.stream_helper import build_ffmpeg_cmd, detect_protocol
+from defora_cli.stream_helper import build_ffmpeg_cmd, detect_protocol, frame_pattern
 
 
 class TestStreamHelper(unittest.TestCase):
@@ -35,6 +35,46 @@ class TestStreamHelper(unittest.TestCase):
         self.assertIn("-method", cmd)
         self.assertIn("POST", cmd)
 
+    def test_frame_pattern_follows_existing_sequence_format(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp)
+            self.assertEqual(frame_pattern(source), str(source / "frame_%05d.png"))
+            (source / "frame_00001.jpg").write_bytes(b"")
+            self.assertEqual(frame_pattern(source), str(source / "frame_%05d.jpg"))
+            self.assertIn(str(source / "frame_%05d.jpg"), build_ffmpeg_cmd(source, "rtmp://x/y", 12, None, "rtmp"))
+
+    def test_build_ffmpeg_cmd_encoders(self):
+        cmd = build_ffmpeg_cmd(Path("/tmp"), "rtmp://x/y", 24, None, "rtmp")
+        self.assertIn("ultrafast", cmd)
+        cmd = build_ffmpeg_cmd(Path("/tmp"), "rtmp://x/y", 24, None, "rtmp", encoder="nvenc")
+        self.assertIn("h264_nvenc", cmd)
+        self.assertNotIn("libx264", cmd)
+        cmd = build_ffmpeg_cmd(Path("/tmp"), "rtmp://x/y", 24, "1280x720", "rtmp", encoder="vaapi")
+        self.assertEqual(cmd[1:3], ["-vaapi_device", "/dev/dri/renderD128"])
+        self.assertIn("scale=1280:720,format=nv12,hwupload", cmd)
+        self.assertNotIn("-pix_fmt", cmd)
+
+    def test_build_ffmpeg_cmd_reads_raw_frames_from_pipe(self):
+        cmd = build_ffmpeg_cmd(Path("/tmp/frames.fifo"), "rtmp://x/y", 12, None, "rtmp", pipe_size="1280x720")
+        self.assertEqual(
+            cmd[1:11],
+            ["-f", "rawvideo", "-pixel_format", "rgb24", "-video_size", "1280x720", "-framerate", "12", "-i", "/tmp/frames.fifo"],
+        )
+        self.assertNotIn("-re", cmd)
+
+    def test_resolve_encoder_prefers_hardware(self):
+        from unittest import mock
+
+        from defora_cli import stream_helper
+
+        with mock.patch.object(stream_helper, "available_encoders", return_value=frozenset({"h264_nvenc"})):
+            self.assertEqual(stream_helper.resolve_encoder("auto"), "nvenc")
+            self.assertEqual(stream_helper.resolve_encoder("x264"), "x264")
+        with mock.patch.object(stream_helper, "available_encoders", return_value=frozenset()):
+            self.assertEqual(stream_helper.resolve_encoder("auto"), "x264")
+
     def test_detect_protocol_rtmp(self):
         """Test RTMP protocol detection"""
         self.assertEqual(detect_protocol("rtmp://example/live/key"), "rtmp")
@@ -53,6 +93,64 @@ class TestStreamHelper(unittest.TestCase):
         """Test default protocol detection"""
         self.assertEqual(detect_protocol("unknown://example"), "rtmp")
 
+    def test_stop_stream_signals_pid_and_removes_pid_file(self):
+        import signal
+        import tempfile
+        from unittest import mock
+
+        from defora_cli import stream_helper
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = Path(tmp) / "stream.pid"
+            pid_file.write_text("4242")
+            with mock.patch.object(stream_helper, "PROC_FILE", pid_file), \
+                    mock.patch.object(stream_helper, "running_pid", return_value=4242), \
+                    mock.patch.object(stream_helper.os, "kill", side_effect=ProcessLookupError) as kill:
+                stream_helper.stop_stream()
+            kill.assert_called_once_with(4242, signal.SIGTERM)
+            self.assertFalse(pid_file.exists())
+
+    def test_stop_stream_skips_pid_reused_by_another_process(self):
+        import signal
+        import tempfile
+        from unittest import mock
+
+        from defora_cli import stream_helper
+
+        read_text = Path.read_text
+
+        def fake_read_text(path, *args, **kwargs):
+            if str(path) == "/proc/4242/comm":
+                return "bash\n"
+            return read_text(path, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = Path(tmp) / "stream.pid"
+            pid_file.write_text("4242")
+            with mock.patch.object(stream_helper, "PROC_FILE", pid_file), \
+                    mock.patch.object(Path, "read_text", autospec=True, side_effect=fake_read_text), \
+                    mock.patch.object(stream_helper.os, "kill") as kill:
+                stream_helper.stop_stream()
+            self.assertNotIn(mock.call(4242, signal.SIGTERM), kill.call_args_list)
+            self.assertFalse(pid_file.exists())
+
+    def test_status_payload_drops_stale_pid_file(self):
+        import tempfile
+        from unittest import mock
+
+        from defora_cli import stream_helper
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = Path(tmp) / "stream.pid"
+            pid_file.write_text("4242")
+            with mock.patch.object(stream_helper, "PROC_FILE", pid_file), \
+                    mock.patch.object(stream_helper, "CONFIG_FILE", Path(tmp) / "config.json"), \
+                    mock.patch.object(stream_helper.os, "kill", side_effect=ProcessLookupError):
+                payload = stream_helper.status_payload()
+            self.assertFalse(payload["running"])
+            self.assertIsNone(payload["pid"])
+            self.assertFalse(pid_file.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
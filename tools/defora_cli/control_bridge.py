@@ -4,13 +4,18 @@ RabbitMQ → mediator bridge for control messages.
 
 Listens on a queue (default: controls) for JSON messages of shape:
   {"controlType": "...", "payload": {...}}
-and forwards the payload keys/values to the mediator using MediatorClient.write().
+and forwards the payload keys/values to the mediator using MediatorClient.write_many().
+Deliveries already buffered locally are merged and forwarded as one batch.
 
 Env:
 - MQ_URL (default: amqp://localhost)
 - MQ_QUEUE (default: controls)
 - MEDIATOR_HOST (default: localhost)
 - MEDIATOR_PORT (default: 8766)
+- MQ_PREFETCH (default: 64) unacked deliveries the broker may push ahead
+- MQ_ACK_BATCH (default: 32) deliveries acknowledged per basic_ack(multiple=True)
+
+Message bodies are parsed with orjson when it is installed (falls back to stdlib json).
 """
 from __future__ import annotations
 
@@ -18,37 +23,135 @@ import json
 import os
 import sys
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import pika
 
 from .mediator_client import MediatorClient
 
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+    def _loads(body: bytes) -> Any:
+        return json.loads(body.decode("utf-8"))
+
 
 MQ_URL = os.getenv("MQ_URL", "amqp://localhost")
 MQ_QUEUE = os.getenv("MQ_QUEUE", "controls")
 MEDIATOR_HOST = os.getenv("MEDIATOR_HOST", "localhost")
 MEDIATOR_PORT = os.getenv("MEDIATOR_PORT", "8766")
+MQ_PREFETCH = int(os.getenv("MQ_PREFETCH", "64"))
+MQ_ACK_BATCH = int(os.getenv("MQ_ACK_BATCH", "32"))
+ACK_FLUSH_SECONDS = 0.2
 
 
-def handle_message(client: MediatorClient, body: bytes) -> str:
+def parse_payload(body: bytes) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Return (payload, "") for a usable message, or (None, reason) otherwise."""
+    # Empty heartbeats and non-object probes never need a full parse.
+    if body.lstrip()[:1] != b"{":
+        return None, "invalid json: empty or not an object"
     try:
-        msg = json.loads(body.decode("utf-8"))
-    except Exception as exc:
-        return f"invalid json: {exc}"
-    payload: Dict[str, Any] = msg.get("payload") or {}
-    if not isinstance(payload, dict):
-        return "payload not a dict"
-    sent = []
+        msg = _loads(body)
+    except ValueError as exc:
+        return None, f"invalid json: {exc}"
+    if not isinstance(msg, dict):
+        return None, "invalid json: not an object"
+    payload = msg.get("payload")
+    if isinstance(payload, dict):
+        return payload, ""
+    if payload is None:
+        return None, "no payload"
+    return None, "payload not a dict"
+
+
+def forward(client: MediatorClient, payload: Dict[str, Any]) -> List[str]:
+    """Write payload to the mediator; returns the keys that were sent.
+
+    Mediator/transport errors propagate so the caller can nack and requeue the
+    deliveries instead of acking writes that never happened.
+    """
+    if not payload:
+        return []
+    write_many = getattr(client, "write_many", None)
+    if write_many is not None:
+        write_many(payload.items())
+        return list(payload)
     for k, v in payload.items():
-        try:
-            client.write(k, v)
-            sent.append(k)
-        except Exception:
-            continue
+        client.write(k, v)
+    return list(payload)
+
+
+def handle_message(client: MediatorClient, body: bytes) -> str:
+    payload, error = parse_payload(body)
+    if payload is None:
+        return error
+    sent = forward(client, payload)
     return f"forwarded: {', '.join(sent) if sent else 'none'}"
 
 
+def handle_batch(client: MediatorClient, bodies: List[bytes]) -> str:
+    """Forward several queued messages with one mediator batch.
+
+    Payloads are merged in delivery order, so a key updated by several messages
+    is written once with its newest value.
+    """
+    merged: Dict[str, Any] = {}
+    ok = 0
+    for body in bodies:
+        payload, _ = parse_payload(body)
+        if payload is None:
+            continue
+        ok += 1
+        merged.update(payload)
+    sent = forward(client, merged)
+    return f"forwarded {ok}/{len(bodies)} messages: {', '.join(sent) if sent else 'none'}"
+
+
+class AckBatcher:
+    """Acknowledges deliveries in batches with basic_ack(multiple=True)."""
+
+    def __init__(self, channel, batch_size: int = MQ_ACK_BATCH):
+        self.channel = channel
+        self.batch_size = max(1, batch_size)
+        self.last_tag: Optional[int] = None
+        self.pending = 0
+
+    def ack(self, delivery_tag: int, count: int = 1) -> None:
+        """Record processed deliveries up to delivery_tag, flushing once batch_size are pending."""
+        self.last_tag = delivery_tag
+        self.pending += count
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def nack(self, delivery_tag: int, requeue: bool, multiple: bool = False) -> None:
+        self.flush()
+        self.channel.basic_nack(delivery_tag=delivery_tag, multiple=multiple, requeue=requeue)
+
+    def flush(self) -> None:
+        if self.last_tag is None:
+            return
+        self.channel.basic_ack(delivery_tag=self.last_tag, multiple=True)
+        self.last_tag = None
+        self.pending = 0
+
+
+def process_batch(client: MediatorClient, acks: AckBatcher, method, bodies: List[bytes]) -> None:
+    """Forward a batch of deliveries, acking on success and nacking when the mediator write fails."""
+    try:
+        result = handle_batch(client, bodies)
+    except Exception as exc:
+        # Requeue once; a batch that fails again is dropped instead of looping forever.
+        acks.nack(method.delivery_tag, requeue=not method.redelivered, multiple=True)
+        print(f"[bridge] error handling messages: {exc}", file=sys.stderr)
+    else:
+        acks.ack(method.delivery_tag, count=len(bodies))
+        print(f"[bridge] {result}")
+
+
 def main():
     client = MediatorClient(MEDIATOR_HOST, MEDIATOR_PORT)
     params = pika.URLParameters(MQ_URL)
@@ -57,14 +160,25 @@ def main():
             connection = pika.BlockingConnection(params)
             channel = connection.channel()
             channel.queue_declare(queue=MQ_QUEUE, durable=False)
-
-            def callback(ch, method, properties, body):
-                result = handle_message(client, body)
-                print(f"[bridge] {result}")
-
-            channel.basic_consume(queue=MQ_QUEUE, on_message_callback=callback, auto_ack=True)
+            channel.basic_qos(prefetch_count=MQ_PREFETCH)
+            acks = AckBatcher(channel)
+            try:
+                client.ensure_connected()
+            except Exception as exc:
+                print(f"[bridge] mediator not reachable yet ({exc}); will retry on first write", file=sys.stderr)
             print(f"[bridge] listening on {MQ_QUEUE}, mediator {MEDIATOR_HOST}:{MEDIATOR_PORT}")
-            channel.start_consuming()
+            bodies: List[bytes] = []
+            for method, _properties, body in channel.consume(MQ_QUEUE, inactivity_timeout=ACK_FLUSH_SECONDS):
+                if method is None:
+                    # Queue went quiet: settle the partial ack batch.
+                    acks.flush()
+                    continue
+                bodies.append(body)
+                # Keep draining deliveries pika already buffered so they share one mediator batch.
+                if len(bodies) < MQ_PREFETCH and channel.get_waiting_message_count():
+                    continue
+                process_batch(client, acks, method, bodies)
+                bodies = []
         except KeyboardInterrupt:
             break
         except Exception as exc:
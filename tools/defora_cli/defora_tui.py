@@ -15,16 +15,47 @@ from __future__ import annotations
 import curses
 import json
 import os
+import queue
+import sys
+import threading
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 
 from .mediator_client import MediatorClient
 
 TABS = ["LIVE", "PROMPTS", "MOTION", "MODULATION", "AUDIO", "SETTINGS", "GENERATE"]
 SOURCES = ["Manual", "Beat", "MIDI"]
+QUIT_KEYS = frozenset((ord("q"), ord("Q")))
+INPUT_TIMEOUT_MS = 33
+# DEC private mode 2026: terminals that support it present each frame atomically; others ignore it.
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+SLIDER_WIDTH = 20
+BAR_TABLE = tuple("█" * i + "-" * (SLIDER_WIDTH - i) for i in range(SLIDER_WIDTH + 1))
+MAX_TIMELINE_FRAMES = 4000  # keeps the timeline pad under curses' 32767-column limit
+TIMELINE_CELL = 7  # " 0001 " plus the joining space
+MOTION_PANEL = (
+    (2, "CAMERA LIVE CONTROLS", curses.A_BOLD),
+    (3, "Pan X:    0.10  [───○────────────]   Pan Y:    0.00  [────○──────────]", curses.A_NORMAL),
+    (4, "Zoom:     0.80  [███████────────]   Tilt:     0.00  [────○──────────]", curses.A_NORMAL),
+    (5, "Rotate H: 0.00  [────○──────────]   Rotate V: 0.00  [────○──────────]", curses.A_NORMAL),
+    (6, "Presets: [1 Static] [2 Orbit] [3 Tunnel Push] [4 Handheld] [5 Chaos]", curses.A_NORMAL),
+    (7, "", curses.A_NORMAL),
+    (8, "MOTION STYLES", curses.A_BOLD),
+    (9, "Saved styles: (none yet)", curses.A_NORMAL),
+    (10, "", curses.A_NORMAL),
+    (11, "Controls: S save current style • N name new style • 1-5 apply preset", curses.A_NORMAL),
+)
+BAR_TEMPLATE = (
+    "F1 LIVE  F2 PROMPTS  F3 MOTION  F4 MODULATION  F5 AUDIO  F6 SETTINGS  F7 GENERATE  "
+    "Deforum: {deforum}  Frames:{frames}"
+)
 DEFAULT_MEDIATOR_HOST = os.getenv("DEFORUMATION_MEDIATOR_HOST", "localhost")
 DEFAULT_MEDIATOR_PORT = os.getenv("DEFORUMATION_MEDIATOR_PORT", "8766")
+# An unreachable mediator should fail the connect probe quickly instead of freezing the UI.
+MEDIATOR_CONNECT_TIMEOUT = float(os.getenv("DEFORUMATION_CONNECT_TIMEOUT", "2.0"))
+MEDIATOR_IO_TIMEOUT = 5.0
 PARAM_TO_MEDIATOR = {
     "cfg": ("cfg", "should_use_deforumation_cfg"),
     "strength": ("strength", "should_use_deforumation_strength"),
@@ -37,11 +68,40 @@ PARAM_TO_MEDIATOR = {
     "tilt": ("rotation_z", "should_use_deforumation_tilt"),
     "fov": ("fov", "should_use_deforumation_fov"),
 }
+PARAM_REMOTE_KEY = {name: remote for name, (remote, _) in PARAM_TO_MEDIATOR.items()}
+# Deduplicated deforumation flags, in declaration order; built once at import.
+MEDIATOR_FLAGS = tuple(dict.fromkeys(flag for _, flag in PARAM_TO_MEDIATOR.values() if flag))
+
+# LIVE tab slider layout: (row, label, param key). First four are VIBE & STYLE, rest CAMERA & MOTION.
+LIVE_SLIDERS = (
+    (24, "Vibe (CFG)", "cfg"),
+    (25, "Strength", "strength"),
+    (26, "Noise / Glitch", "noise"),
+    (27, "Cadence", "cadence"),
+    (24, "Zoom", "zoom"),
+    (25, "Pan X", "panx"),
+    (26, "Pan Y", "pany"),
+    (27, "Rotate Y", "rotate"),
+    (28, "Tilt (Z)", "tilt"),
+    (29, "FOV", "fov"),
+)
+_SOURCES_LABEL = " ".join(SOURCES)
+LIVE_SOURCE_LINES = (
+    f"Vibe:     {_SOURCES_LABEL}",
+    f"Strength: {_SOURCES_LABEL}",
+    f"Zoom:     {_SOURCES_LABEL}",
+    f"Noise:    {_SOURCES_LABEL}",
+    "(TAB cycles • SPACE selects source)",
+    "",
+    "Beat macros:",
+)
 
 
 class SafeWindow:
     """Wraps a curses window and drops out-of-bounds writes instead of erroring."""
 
+    __slots__ = ("_win",)
+
     def __init__(self, win):
         self._win = win
 
@@ -58,11 +118,29 @@ class SafeWindow:
             # Ignore curses overflow errors so small terminals don't crash.
             pass
 
+    def addnstr_eol(self, y: int, x: int, text: str, n: int, attr: int = 0):
+        """addnstr, then clear the rest of the row so shorter text leaves no stale cells."""
+        h, w = self._win.getmaxyx()
+        if y < 0 or y >= h or x < 0 or x >= w:
+            return
+        self.addnstr(y, x, text, n, attr)
+        try:
+            self._win.clrtoeol()
+        except curses.error:
+            pass
+
+    def noutrefresh(self):
+        """Stage this window for the next doupdate() without touching the terminal."""
+        try:
+            self._win.noutrefresh()
+        except curses.error:
+            pass
+
     def __getattr__(self, name):
         return getattr(self._win, name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Param:
     name: str
     value: float
@@ -70,9 +148,18 @@ class Param:
     max_value: float = 1.5
     step: float = 0.02
     source: str = "Manual"  # Manual / Beat / MIDI
+    _inv_range: float = field(init=False, repr=False, compare=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        span = self.max_value - self.min_value
+        self._inv_range = 1.0 / span if span else 0.0
 
     def clamp(self) -> None:
-        self.value = max(self.min_value, min(self.value, self.max_value))
+        v = self.value
+        if v > self.max_value:
+            self.value = self.max_value
+        elif v < self.min_value:
+            self.value = self.min_value
 
     def adjust(self, delta: float) -> None:
         self.value += delta
@@ -86,6 +173,8 @@ class Param:
 class DeforumBridge:
     """Thin helper around MediatorClient to keep connection state + deforum flags."""
 
+    __slots__ = ("host", "port", "client", "connected", "last_error")
+
     def __init__(self, host: str, port: str, client: Optional[MediatorClient] = None):
         self.host = host
         self.port = str(port)
@@ -93,18 +182,14 @@ class DeforumBridge:
         self.connected = False
         self.last_error = ""
 
-    @property
-    def flags(self) -> List[str]:
-        seen = set()
-        for _, flag in PARAM_TO_MEDIATOR.values():
-            if flag and flag not in seen:
-                seen.add(flag)
-        return list(seen)
+    flags = MEDIATOR_FLAGS
 
     def connect(self) -> bool:
         try:
             if self.client is None:
-                self.client = MediatorClient(self.host, self.port)
+                self.client = MediatorClient(
+                    self.host, self.port, timeout=MEDIATOR_IO_TIMEOUT, connect_timeout=MEDIATOR_CONNECT_TIMEOUT
+                )
         except Exception as exc:
             self.last_error = str(exc)
             self.connected = False
@@ -122,38 +207,52 @@ class DeforumBridge:
             self.connected = False
             return False
 
+    def _read_many(self, keys: List[str]) -> List[object]:
+        read_many = getattr(self.client, "read_many", None)
+        if read_many is not None:
+            return read_many(keys)
+        return [self.client.read(key) for key in keys]
+
+    def _write_many(self, pairs: List[tuple]) -> None:
+        write_many = getattr(self.client, "write_many", None)
+        if write_many is not None:
+            write_many(pairs)
+            return
+        for key, value in pairs:
+            self.client.write(key, value)
+
     def enable_flags(self) -> None:
         if not self.client:
             return
-        for flag in self.flags:
-            try:
-                self.client.write(flag, 1)
-            except Exception as exc:  # pragma: no cover - runtime failure path
-                self.connected = False
-                self.last_error = str(exc)
-                break
+        try:
+            self._write_many([(flag, 1) for flag in MEDIATOR_FLAGS])
+        except Exception as exc:  # pragma: no cover - runtime failure path
+            self.connected = False
+            self.last_error = str(exc)
 
     def pull_params(self, params: Dict[str, Param]) -> None:
         if not self.connected or not self.client:
             return
-        for name, (remote_key, _) in PARAM_TO_MEDIATOR.items():
-            if name not in params or not remote_key:
+        names = [name for name, remote_key in PARAM_REMOTE_KEY.items() if remote_key and name in params]
+        try:
+            values = self._read_many([PARAM_REMOTE_KEY[name] for name in names])
+        except Exception as exc:
+            self.connected = False
+            self.last_error = str(exc)
+            return
+        for name, val in zip(names, values):
+            if val is None:
                 continue
             try:
-                val = self.client.read(remote_key)
-                if val is None:
-                    continue
                 params[name].value = float(val)
-                params[name].clamp()
-            except Exception as exc:
-                self.connected = False
-                self.last_error = str(exc)
-                break
+            except (TypeError, ValueError):
+                continue
+            params[name].clamp()
 
     def write_param(self, name: str, value: float) -> bool:
         if not self.connected or not self.client:
             return False
-        remote_key = PARAM_TO_MEDIATOR.get(name, (None, None))[0]
+        remote_key = PARAM_REMOTE_KEY.get(name)
         if not remote_key:
             return False
         try:
@@ -164,6 +263,21 @@ class DeforumBridge:
             self.last_error = str(exc)
             return False
 
+    def write_params(self, values: Dict[str, float]) -> bool:
+        """Write several params in one mediator batch."""
+        if not self.connected or not self.client:
+            return False
+        pairs = [(PARAM_REMOTE_KEY[name], value) for name, value in values.items() if PARAM_REMOTE_KEY.get(name)]
+        if not pairs:
+            return False
+        try:
+            self._write_many(pairs)
+            return True
+        except Exception as exc:
+            self.connected = False
+            self.last_error = str(exc)
+            return False
+
     def fetch_frame_count(self) -> int:
         if not self.connected or not self.client:
             return 0
@@ -198,12 +312,96 @@ class DeforumBridge:
             return False
 
 
+class MediatorWorker(threading.Thread):
+    """Runs DeforumBridge writes and frame-count polling off the UI thread.
+
+    The UI enqueues writes and reads the last polled frame count from snapshot();
+    it never waits on the mediator socket itself.
+    """
+
+    _STOP = object()
+
+    def __init__(self, bridge: DeforumBridge, poll_interval: float = 0.5):
+        super().__init__(name="mediator-worker", daemon=True)
+        self.bridge = bridge
+        self.poll_interval = poll_interval
+        self.cmd_q: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._state = {"frames_total": None}
+
+    def write(self, name: str, value: float) -> None:
+        self.cmd_q.put((name, value))
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self.cmd_q.put(self._STOP)
+        self.join(timeout)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._state)
+
+    def run(self) -> None:
+        while True:
+            try:
+                cmd = self.cmd_q.get(timeout=self.poll_interval)
+            except queue.Empty:
+                cmd = None
+            if cmd is self._STOP:
+                break
+            if cmd is not None:
+                # Coalesce everything queued since the last flush: newest value per param, one batch.
+                pending = {cmd[0]: cmd[1]}
+                stop = False
+                while True:
+                    try:
+                        nxt = self.cmd_q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is self._STOP:
+                        stop = True
+                        break
+                    pending[nxt[0]] = nxt[1]
+                self.bridge.write_params(pending)
+                if stop:
+                    break
+            elif self.bridge.connected:
+                frames = self.bridge.fetch_frame_count()
+                with self._lock:
+                    self._state["frames_total"] = frames
+
+
+def doupdate() -> None:
+    """curses.doupdate() that tolerates running without an initialised screen."""
+    try:
+        curses.doupdate()
+    except curses.error:
+        pass
+
+
 def center_text(win, y: int, text: str, attr: int = 0):
     h, w = win.getmaxyx()
     x = max(0, (w - len(text)) // 2)
     win.addnstr(y, x, text, w - 1, attr)
 
 
+@dataclass(slots=True, frozen=True)
+class Layout:
+    """Screen geometry; recomputed only when curses reports KEY_RESIZE."""
+
+    h: int
+    w: int
+    left_w: int
+    col1: int
+    col2: int
+    col3: int
+    preview_w: int
+
+    @classmethod
+    def from_size(cls, h: int, w: int) -> "Layout":
+        left_w = int(w * 0.6)
+        return cls(h, w, left_w, 1, int(w * 0.4), int(w * 0.7), left_w - 2)
+
+
 class DeforaTUI:
     def __init__(
         self,
@@ -228,6 +426,9 @@ class DeforaTUI:
             "tilt": Param("Tilt (Z)", 0.0, min_value=-180, max_value=180, step=1.0),
             "fov": Param("FOV", 70.0, min_value=1.0, max_value=180.0, step=1.0),
         }
+        # The param set is fixed after construction; cache its order for j/k navigation.
+        self._param_keys = tuple(self.params)
+        self._param_index = {k: i for i, k in enumerate(self._param_keys)}
         self.selected_param = "cfg"
         self.session = "clown_set_01"
         self.seed = 42490527
@@ -240,10 +441,14 @@ class DeforaTUI:
         self.mediator_host = mediator_host or DEFAULT_MEDIATOR_HOST
         self.mediator_port = str(mediator_port or DEFAULT_MEDIATOR_PORT)
         self.bridge = DeforumBridge(self.mediator_host, self.mediator_port, mediator)
+        self.worker: Optional[MediatorWorker] = None  # set while run() is active
+        self._pending_params: set = set()  # adjusted since the last frame, not yet sent
+        self._sync_output = False  # bracket frames with SYNC_BEGIN/SYNC_END; enabled by run()
         self.frames_total = 0
         self.frame_cursor = 0
         self.frames_dir: Optional[Path] = self.detect_frames_dir()
         self.preview_cache: Dict[str, List[str]] = {}
+        self._preview_rows: Dict[int, tuple] = {}  # width -> (edge row, blank interior row)
         self.preview_error: str = ""
         # LoRA tab: catalog labels + A/B slots (name, strength Param)
         self.lora_catalog: List[str] = [
@@ -275,6 +480,24 @@ class DeforaTUI:
             os.getenv("DEFORA_TUI_LORA_STATE", str(Path.home() / ".config" / "defora" / "tui_lora.json"))
         )
         self._load_lora_state_safe()
+        self._build_keymaps()
+        self._dirty = True  # redraw only after input that changed something
+        self._static_key: tuple = ()
+        self._header_line = ""
+        self._divider_line = ""
+        self._bar_key: tuple = ()
+        self._layout = Layout.from_size(*self.stdscr.getmaxyx())
+        self._view_key: tuple = ()
+        self._slider_cache: Dict[tuple, tuple] = {}
+        # Pads (None = not built yet, False = unavailable) staged after stdscr in draw().
+        self._pads_ok: Optional[bool] = None
+        self._pending_pads: List[tuple] = []
+        self._motion_pad = None
+        self._timeline_pad = None
+        self._timeline_pad_frames = 0
+        self._timeline_pad_cursor: Optional[int] = None
+        self._timeline_cache: tuple = (None, "")  # ((frames_total, cursor, width), text)
+        self._bar_line = ""
 
     def detect_frames_dir(self) -> Optional[Path]:
         env = os.getenv("DEFORUMATION_FRAMES_DIR")
@@ -338,96 +561,166 @@ class DeforaTUI:
 
     def run(self):
         curses.curs_set(0)
-        self.stdscr.nodelay(False)
+        # ~30 FPS input timeout so frame-count updates from the worker show without a keypress.
+        self.stdscr.timeout(INPUT_TIMEOUT_MS)
+        self._sync_output = not os.getenv("DEFORA_NO_SYNC")
         self.connect_and_sync()
-        while True:
-            self.draw()
-            key = self.stdscr.getch()
-            if key in (ord("q"), ord("Q")):
-                break
-            if key in (curses.KEY_F1, ord("1")):
-                self.tab = 0
-            elif key in (curses.KEY_F2, ord("2")):
-                self.tab = 1
-            elif key in (curses.KEY_F3, ord("3")):
-                self.tab = 2
-            elif key in (curses.KEY_F4, ord("4")):
-                self.tab = 3
-            elif key in (curses.KEY_F5, ord("5")):
-                self.tab = 4
-            elif key in (curses.KEY_F6, ord("6")):
-                self.tab = 5
-            elif key in (curses.KEY_F7, ord("7")):
-                self.tab = 6
-            elif self.tab == 1 and key in (ord("p"), ord("P")):
-                self.prompts_sub_tab = (self.prompts_sub_tab + 1) % 3
-                labels = ["Prompts", "LoRA", "ControlNet"]
-                self.status = f"Prompts: {labels[self.prompts_sub_tab]}"
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (ord("1"), ord("2"), ord("3"), ord("4"), ord("5"), ord("6")):
-                self.lora_slot_sel = int(chr(key)) - 1
-                self.status = f"LoRA slot {self.lora_slot_sel + 1} selected"
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (ord("w"), ord("W")):
-                self._save_lora_state()
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (ord("e"), ord("E")):
-                self._export_lora_preset_file()
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (ord(","), ord(".")):
-                d = -self.lora_crossfader.step if key == ord(",") else self.lora_crossfader.step
-                self.lora_crossfader.adjust(d)
-                self.lora_crossfader.clamp()
-                self.status = f"Crossfader → {self.lora_crossfader.value:.2f}"
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (curses.KEY_LEFT, ord("h")):
-                self.adjust_lora_strength(-self.lora_a[0][1].step)
-            elif self.tab == 1 and self.prompts_sub_tab == 1 and key in (curses.KEY_RIGHT, ord("l")):
-                self.adjust_lora_strength(self.lora_a[0][1].step)
-            elif self.tab == 5 and key in (ord("p"), ord("P")):
-                self.settings_sub_tab = (self.settings_sub_tab + 1) % 4
-                labels = ["Engine", "Forge", "MIDI", "Presets"]
-                self.status = f"Settings: {labels[self.settings_sub_tab]}"
-            elif key in (curses.KEY_LEFT, ord("h")):
-                self.adjust_selected(-self.params[self.selected_param].step)
-            elif key in (curses.KEY_RIGHT, ord("l")):
-                self.adjust_selected(self.params[self.selected_param].step)
-            elif key == ord("<"):
-                self.move_frame_cursor(-1)
-            elif key == ord(">"):
-                self.move_frame_cursor(1)
-            elif key in (ord(" "),):
-                if self.tab == 0:
-                    self.params[self.selected_param].next_source()
-                elif self.tab == 2:
-                    self.assign_catalog_to_slot()
-            elif key in (ord("k"), curses.KEY_UP):
-                if self.tab == 2:
-                    self.lora_catalog_idx = (self.lora_catalog_idx - 1) % len(self.lora_catalog)
-                    self.status = f"Catalog: {self.lora_catalog[self.lora_catalog_idx]}"
-                else:
-                    self.prev_param()
-            elif key in (ord("j"), curses.KEY_DOWN):
-                if self.tab == 2:
-                    self.lora_catalog_idx = (self.lora_catalog_idx + 1) % len(self.lora_catalog)
-                    self.status = f"Catalog: {self.lora_catalog[self.lora_catalog_idx]}"
-                else:
-                    self.next_param()
-            elif key == ord("r"):
-                self.connect_and_sync()
-            elif key == ord("g"):
-                self.trigger_generation()
+        self.worker = MediatorWorker(self.bridge)
+        self.worker.start()
+        self._dirty = True
+        try:
+            while True:
+                self.apply_worker_snapshot()
+                if self._dirty:
+                    self.draw()
+                key = self.stdscr.getch()
+                if key == -1:
+                    continue
+                if key in QUIT_KEYS:
+                    break
+                self.handle_key(key)
+        finally:
+            self.flush_param_writes()
+            self.worker.stop()
+            self.worker = None
+
+    def apply_worker_snapshot(self) -> None:
+        if self.worker is None:
+            return
+        snap = self.worker.snapshot()
+        frames = snap["frames_total"]
+        if frames is not None and frames != self.frames_total:
+            self.frames_total = frames
+            self.frame_cursor = min(self.frame_cursor, max(frames - 1, 0))
+            self._dirty = True
+        # Connection state lives on the bridge; the worker flips it when a write fails.
+        if self.engine_status == "CONNECTED" and not self.bridge.connected:
+            self.engine_status = "DISCONNECTED"
+            self.status = f"Mediator write failed: {self.bridge.last_error} (press r)"
+            self._dirty = True
+
+    def _build_keymaps(self) -> None:
+        """Build keycode → handler tables once; run() dispatches with dict lookups."""
+        self._tab_keys: Dict[int, int] = {}
+        for idx, fkey in enumerate(
+            (curses.KEY_F1, curses.KEY_F2, curses.KEY_F3, curses.KEY_F4, curses.KEY_F5, curses.KEY_F6, curses.KEY_F7)
+        ):
+            self._tab_keys[fkey] = idx
+            self._tab_keys[ord(str(idx + 1))] = idx
+
+        def bind(table: Dict[int, Callable[[int], None]], keys, handler) -> None:
+            for k in keys:
+                table[k] = handler
+
+        lora: Dict[int, Callable[[int], None]] = {}
+        bind(lora, (ord("p"), ord("P")), lambda key: self._cycle_prompts_sub_tab())
+        bind(lora, [ord(c) for c in "123456"], self._select_lora_slot)
+        bind(lora, (ord("w"), ord("W")), lambda key: self._save_lora_state())
+        bind(lora, (ord("e"), ord("E")), lambda key: self._export_lora_preset_file())
+        bind(lora, (ord(","), ord(".")), self._nudge_crossfader)
+        bind(lora, (curses.KEY_LEFT, ord("h")), lambda key: self.adjust_lora_strength(-self.lora_a[0][1].step))
+        bind(lora, (curses.KEY_RIGHT, ord("l")), lambda key: self.adjust_lora_strength(self.lora_a[0][1].step))
+        self._lora_keymap = lora
+        self._prompts_keymap = {k: lora[k] for k in (ord("p"), ord("P"))}
+        self._settings_keymap: Dict[int, Callable[[int], None]] = {}
+        bind(self._settings_keymap, (ord("p"), ord("P")), lambda key: self._cycle_settings_sub_tab())
+
+        keymap: Dict[int, Callable[[int], None]] = {}
+        bind(keymap, (curses.KEY_LEFT, ord("h")), lambda key: self.adjust_selected(-self.params[self.selected_param].step))
+        bind(keymap, (curses.KEY_RIGHT, ord("l")), lambda key: self.adjust_selected(self.params[self.selected_param].step))
+        keymap[ord("<")] = lambda key: self.move_frame_cursor(-1)
+        keymap[ord(">")] = lambda key: self.move_frame_cursor(1)
+        keymap[ord(" ")] = lambda key: self._toggle_or_assign()
+        bind(keymap, (ord("k"), curses.KEY_UP), lambda key: self._step_list(-1))
+        bind(keymap, (ord("j"), curses.KEY_DOWN), lambda key: self._step_list(1))
+        keymap[ord("r")] = lambda key: self.connect_and_sync()
+        keymap[ord("g")] = lambda key: self.trigger_generation()
+        self._keymap = keymap
+
+    def handle_key(self, key: int) -> None:
+        tab = self._tab_keys.get(key)
+        if tab is not None:
+            self.tab = tab
+            self._dirty = True
+            return
+        if key == curses.KEY_RESIZE:
+            self._layout = Layout.from_size(*self.stdscr.getmaxyx())
+            self._dirty = True
+            return
+        if self.tab == 1:
+            context = self._lora_keymap if self.prompts_sub_tab == 1 else self._prompts_keymap
+        elif self.tab == 5:
+            context = self._settings_keymap
+        else:
+            context = None
+        handler = (context and context.get(key)) or self._keymap.get(key)
+        if handler is not None:
+            handler(key)
+            self._dirty = True
+
+    def _cycle_prompts_sub_tab(self) -> None:
+        self.prompts_sub_tab = (self.prompts_sub_tab + 1) % 3
+        labels = ["Prompts", "LoRA", "ControlNet"]
+        self.status = f"Prompts: {labels[self.prompts_sub_tab]}"
+
+    def _cycle_settings_sub_tab(self) -> None:
+        self.settings_sub_tab = (self.settings_sub_tab + 1) % 4
+        labels = ["Engine", "Forge", "MIDI", "Presets"]
+        self.status = f"Settings: {labels[self.settings_sub_tab]}"
+
+    def _select_lora_slot(self, key: int) -> None:
+        self.lora_slot_sel = int(chr(key)) - 1
+        self.status = f"LoRA slot {self.lora_slot_sel + 1} selected"
+
+    def _nudge_crossfader(self, key: int) -> None:
+        d = -self.lora_crossfader.step if key == ord(",") else self.lora_crossfader.step
+        self.lora_crossfader.adjust(d)
+        self.lora_crossfader.clamp()
+        self.status = f"Crossfader → {self.lora_crossfader.value:.2f}"
+
+    def _toggle_or_assign(self) -> None:
+        if self.tab == 0:
+            self.params[self.selected_param].next_source()
+        elif self.tab == 2:
+            self.assign_catalog_to_slot()
+
+    def _step_list(self, delta: int) -> None:
+        if self.tab == 2:
+            self.lora_catalog_idx = (self.lora_catalog_idx + delta) % len(self.lora_catalog)
+            self.status = f"Catalog: {self.lora_catalog[self.lora_catalog_idx]}"
+        elif delta < 0:
+            self.prev_param()
+        else:
+            self.next_param()
 
     def adjust_selected(self, delta: float):
         p = self.params[self.selected_param]
         p.adjust(delta)
-        self.status = f"{p.name} -> {p.value:.2f} ({p.source})"
+        # Formatted on the next read of .status (normally the next draw), not per key repeat.
+        self._status_parts = (p.name, p.value, p.source)
         self.push_param_to_mediator(self.selected_param)
 
+    @property
+    def status(self) -> str:
+        parts = self._status_parts
+        if parts is not None:
+            name, value, source = parts
+            self._status = f"{name} -> {value:.2f} ({source})"
+            self._status_parts = None
+        return self._status
+
+    @status.setter
+    def status(self, text: str) -> None:
+        self._status = text
+        self._status_parts = None
+
     def prev_param(self):
-        keys = list(self.params.keys())
-        idx = keys.index(self.selected_param)
-        self.selected_param = keys[(idx - 1) % len(keys)]
+        keys = self._param_keys
+        self.selected_param = keys[(self._param_index[self.selected_param] - 1) % len(keys)]
 
     def next_param(self):
-        keys = list(self.params.keys())
-        idx = keys.index(self.selected_param)
-        self.selected_param = keys[(idx + 1) % len(keys)]
+        keys = self._param_keys
+        self.selected_param = keys[(self._param_index[self.selected_param] + 1) % len(keys)]
 
     def deforum_status(self) -> str:
         if self.bridge.connected:
@@ -455,9 +748,23 @@ class DeforaTUI:
             self.status = f"Deforum disconnected: {msg} (press r to retry)"
 
     def push_param_to_mediator(self, name: str):
+        """Mark a param for sending; draw() flushes pending params once per frame."""
         if not self.bridge.connected:
             return
-        if not self.bridge.write_param(name, self.params[name].value):
+        self._pending_params.add(name)
+
+    def flush_param_writes(self) -> None:
+        if not self._pending_params:
+            return
+        values = {name: self.params[name].value for name in self._pending_params}
+        self._pending_params.clear()
+        if not self.bridge.connected:
+            return
+        if self.worker is not None:
+            for name, value in values.items():
+                self.worker.write(name, value)
+            return
+        if not self.bridge.write_params(values):
             self.engine_status = "DISCONNECTED"
             self.status = f"Mediator write failed: {self.bridge.last_error} (press r)"
         else:
@@ -486,20 +793,73 @@ class DeforaTUI:
         self.frame_cursor = max(0, min(self.frame_cursor + delta, self.frames_total - 1))
         self.status = f"Frame {self.frame_cursor}/{self.frames_total - 1}"
 
+    def _new_pad(self, rows: int, cols: int):
+        """Create a curses pad, or return False when pads are unavailable (no initscr)."""
+        if self._pads_ok is False:
+            return False
+        try:
+            pad = curses.newpad(rows, cols)
+        except curses.error:
+            self._pads_ok = False
+            return False
+        self._pads_ok = True
+        return pad
+
+    def _stage_pad(self, pad, prow: int, pcol: int, y0: int, x0: int, y1: int, x1: int) -> None:
+        h, w = self._layout.h, self._layout.w
+        ph, pw = pad.getmaxyx()
+        y1 = min(y1, h - 1, y0 + ph - prow - 1)
+        x1 = min(x1, w - 1, x0 + pw - pcol - 1)
+        if y1 >= y0 and x1 >= x0:
+            self._pending_pads.append((pad, prow, pcol, y0, x0, y1, x1))
+
+    def _draw_timeline_pad(self, y: int, x: int, width: int) -> bool:
+        """Show the frame timeline by scrolling a pre-rendered pad; False means use the string path."""
+        total, cursor = self.frames_total, self.frame_cursor
+        if not self.bridge.connected or total <= 0 or total > MAX_TIMELINE_FRAMES:
+            return False
+        if self._timeline_pad_frames != total:
+            pad = self._new_pad(1, total * TIMELINE_CELL + 1)
+            if not pad:
+                return False
+            for idx in range(total):
+                pad.addstr(0, idx * TIMELINE_CELL, f" {idx:04d} ")
+            self._timeline_pad, self._timeline_pad_frames, self._timeline_pad_cursor = pad, total, None
+        pad = self._timeline_pad
+        if self._timeline_pad_cursor != cursor:
+            old = self._timeline_pad_cursor
+            if old is not None and old < total:
+                pad.addstr(0, old * TIMELINE_CELL, f" {old:04d} ")
+            pad.addstr(0, cursor * TIMELINE_CELL, f"[{cursor:04d}]")
+            self._timeline_pad_cursor = cursor
+        prefix = f"Frames {cursor + 1}/{total}: "
+        self.stdscr.addnstr_eol(y, x, prefix, width)
+        view_w = width - len(prefix)
+        window = max(1, min(total, view_w // TIMELINE_CELL))
+        start = max(0, min(cursor - window // 2, total - window))
+        view_x = x + len(prefix)
+        self._stage_pad(pad, 0, start * TIMELINE_CELL, y, view_x, y, view_x + window * TIMELINE_CELL - 2)
+        return True
+
     def format_frame_timeline(self, width: int) -> str:
         if not self.bridge.connected:
             return "Frames: mediator disconnected (press r to reconnect)"
         if self.frames_total <= 0:
             return "Frames: no frames reported (press r to retry)"
+        key = (self.frames_total, self.frame_cursor, width)
+        if key == self._timeline_cache[0]:
+            return self._timeline_cache[1]
         window = max(1, min(self.frames_total, max(1, width // 8)))
         start = max(0, self.frame_cursor - window // 2)
         end = min(self.frames_total, start + window)
         start = max(0, end - window)
-        parts: List[str] = []
-        for idx in range(start, end):
-            label = f"{idx:04d}"
-            parts.append(f"[{label}]" if idx == self.frame_cursor else f" {label} ")
-        return f"Frames {self.frame_cursor + 1}/{self.frames_total}: " + " ".join(parts)
+        cursor = self.frame_cursor
+        parts = [f" {idx:04d} " for idx in range(start, end)]
+        if start <= cursor < end:
+            parts[cursor - start] = f"[{cursor:04d}]"
+        text = f"Frames {cursor + 1}/{self.frames_total}: " + " ".join(parts)
+        self._timeline_cache = (key, text)
+        return text
 
     def trigger_generation(self):
         if not self.bridge.connected:
@@ -588,10 +948,10 @@ class DeforaTUI:
         self.status = f"LoRA strength → {row[idx][1].value:.2f}"
 
     def draw_lora(self) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(2, 1, "LoRA — GROUP A / GROUP B (terminal)", w - 2, curses.A_BOLD)
         cur = self.lora_catalog[self.lora_catalog_idx]
-        self.stdscr.addnstr(3, 1, f"Catalog (j/k): {cur}"[: w - 2], w - 2)
+        self.stdscr.addnstr_eol(3, 1, f"Catalog (j/k): {cur}", w - 2)
         self.stdscr.addnstr(
             4,
             1,
@@ -618,17 +978,28 @@ class DeforaTUI:
         self.stdscr.addnstr(h - 4, 1, preset_hint[: w - 2], w - 2)
 
     def draw(self):
-        self.stdscr.erase()
-        h, w = self.stdscr.getmaxyx()
-        header = f"DEFORA TUI v0.2  Session: {self.session}  [Q]uit  [F1..F7]"
-        self.stdscr.addnstr(0, 0, header.ljust(w), w - 1, curses.A_REVERSE)
-        bar = (
-            f"F1 LIVE  F2 PROMPTS  F3 MOTION  F4 MODULATION  F5 AUDIO  F6 SETTINGS  F7 GENERATE  "
-            f"Deforum: {self.deforum_status()}  Frames:{self.frames_total}"
-        )
-        self.stdscr.addnstr(1, 0, bar.ljust(w), w - 1, curses.A_REVERSE)
-
-        if self.tab == 0:
+        L = self._layout
+        h, w = L.h, L.w
+        # Only clear when the view changes; otherwise panels overwrite their own cells
+        # (dynamic lines are padded) so ncurses ships just the changed ones.
+        view_key = (self.tab, self.prompts_sub_tab, self.settings_sub_tab, L)
+        fresh = view_key != self._view_key
+        if fresh:
+            self.stdscr.erase()
+            self._slider_cache.clear()
+            self._view_key = view_key
+        if (h, w, self.session) != self._static_key:
+            self._rebuild_static_cache(h, w)
+        self.stdscr.addnstr(0, 0, self._header_line, w - 1, curses.A_REVERSE)
+        bar_key = (w, self.deforum_status(), self.frames_total)
+        if bar_key != self._bar_key:
+            self._bar_line = BAR_TEMPLATE.format_map({"deforum": bar_key[1], "frames": bar_key[2]}).ljust(w)
+            self._bar_key = bar_key
+        self.stdscr.addnstr(1, 0, self._bar_line, w - 1, curses.A_REVERSE)
+
+        if not fresh and self._panel_is_static():
+            pass  # static panel cells are still on screen from the last full draw
+        elif self.tab == 0:
             self.draw_live()
         elif self.tab == 1:
             self.draw_prompts()
@@ -643,15 +1014,60 @@ class DeforaTUI:
         elif self.tab == 6:
             self.draw_generate()
 
-        self.stdscr.addnstr(h - 2, 0, "─" * (w - 1), w - 1)
-        self.stdscr.addnstr(h - 1, 0, self.status.ljust(w - 1), w - 1)
-        self.stdscr.refresh()
+        self.stdscr.addnstr(h - 2, 0, self._divider_line, w - 1)
+        self.stdscr.addnstr_eol(h - 1, 0, self.status, w - 1)
+        # Stage the frame (pads after stdscr so they land on top) and flush it in one terminal write.
+        self.stdscr.noutrefresh()
+        for args in self._pending_pads:
+            try:
+                args[0].noutrefresh(*args[1:])
+            except curses.error:
+                pass
+        self._pending_pads.clear()
+        if self._sync_output:
+            self._write_terminal(SYNC_BEGIN)
+            doupdate()
+            self._write_terminal(SYNC_END)
+        else:
+            doupdate()
+        self._dirty = False
+        self.flush_param_writes()
+
+    def _panel_is_static(self) -> bool:
+        """True when the current tab body has no live values (LoRA and Forge panels do)."""
+        if self.tab in (2, 3, 4, 6):
+            return True
+        if self.tab == 1:
+            return self.prompts_sub_tab != 1
+        if self.tab == 5:
+            return self.settings_sub_tab != 1
+        return False
+
+    @staticmethod
+    def _write_terminal(seq: str) -> None:
+        """Write a control sequence straight to the terminal, outside curses' buffer."""
+        try:
+            sys.stdout.write(seq)
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+
+    def _rebuild_static_cache(self, h: int, w: int) -> None:
+        """Rebuild lines that only depend on the terminal size (and session name)."""
+        header = f"DEFORA TUI v0.2  Session: {self.session}  [Q]uit  [F1..F7]"
+        self._header_line = header.ljust(w)
+        self._divider_line = "─" * (w - 1)
+        self._static_key = (h, w, self.session)
 
     def draw_preview_block(self, y: int, x: int, width: int, height: int):
-        self.stdscr.addnstr(y, x, "+" + "-" * (width - 2) + "+", width)
+        rows = self._preview_rows.get(width)
+        if rows is None:
+            rows = self._preview_rows[width] = ("+" + "-" * (width - 2) + "+", "|" + " " * (width - 2) + "|")
+        edge, mid = rows
+        self.stdscr.addnstr(y, x, edge, width)
         for i in range(1, height - 1):
-            self.stdscr.addnstr(y + i, x, "|" + " " * (width - 2) + "|", width)
-        self.stdscr.addnstr(y + height - 1, x, "+" + "-" * (width - 2) + "+", width)
+            self.stdscr.addnstr(y + i, x, mid, width)
+        self.stdscr.addnstr(y + height - 1, x, edge, width)
         inner_w = max(0, width - 2)
         inner_h = max(0, height - 2)
         frame_path = self.resolve_frame_path()
@@ -671,58 +1087,47 @@ class DeforaTUI:
                 start_x = x + 1 + max(0, (inner_w - len(msg)) // 2)
                 self.stdscr.addnstr(start_y, start_x, msg[:inner_w], inner_w)
 
-    def draw_slider(self, y: int, label: str, param: Param, active: bool = False):
-        bar_w = 20
-        filled = int(((param.value - param.min_value) / (param.max_value - param.min_value)) * bar_w)
-        bar = "█" * filled + "-" * (bar_w - filled)
-        line = f"{label:<15} {param.value:>6.2f}  [{bar}]"
+    def draw_slider(self, y: int, label: str, param: Param, active: bool = False, x: int = 1):
+        state = (param.value, active)
+        if self._slider_cache.get((y, x)) == state:
+            return
+        self._slider_cache[(y, x)] = state
+        filled = int((param.value - param.min_value) * param._inv_range * SLIDER_WIDTH)
+        bar = BAR_TABLE[max(0, min(SLIDER_WIDTH, filled))]
+        # Fixed width for every value in the widest range (-180.00), so a shorter value
+        # never leaves a stale "]" behind now that unchanged screens are not erased.
+        line = f"{label:<15} {param.value:>7.2f}  [{bar}]"
         attr = curses.A_REVERSE if active else curses.A_NORMAL
-        self.stdscr.addnstr(y, 1, line, len(line), attr)
+        self.stdscr.addnstr(y, x, line, len(line), attr)
 
     def draw_live(self):
-        h, w = self.stdscr.getmaxyx()
-        left_w = int(w * 0.6)
+        L = self._layout
+        h, w = L.h, L.w
         # Preview block
-        self.draw_preview_block(3, 1, left_w - 2, 12)
+        self.draw_preview_block(3, 1, L.preview_w, 12)
         self.stdscr.addnstr(16, 1, f"Time: 00:08.5  Seed: {self.seed}   Playhead: █████░░░░░", w - 2)
 
         # Waveform strip
         self.stdscr.addnstr(18, 1, "FRAMES (< > scrub, g generate)", w - 2, curses.A_BOLD)
-        timeline = self.format_frame_timeline(w - 2)
-        self.stdscr.addnstr(19, 1, timeline, w - 2)
+        if not self._draw_timeline_pad(19, 1, w - 2):
+            timeline = self.format_frame_timeline(w - 2)
+            self.stdscr.addnstr_eol(19, 1, timeline, w - 2)
         self.stdscr.addnstr(20, 1, "Tempo: 120 BPM        |      |      |      |      |      |      |", w - 2)
         self.stdscr.addnstr(21, 1, "Audio:   /\\/\\__/\\/\\_/\\/\\____/\\/\\/\\/\\____/\\/\\____/\\/\\/\\/\\____/\\/\\____", w - 2)
 
         # Columns
-        col1_x = 1
-        col2_x = int(w * 0.4)
-        col3_x = int(w * 0.7)
+        col1_x, col2_x, col3_x = L.col1, L.col2, L.col3
         self.stdscr.addnstr(23, col1_x, "VIBE & STYLE", w - 2, curses.A_BOLD)
-        self.draw_slider(24, "Vibe (CFG)", self.params["cfg"], self.selected_param == "cfg")
-        self.draw_slider(25, "Strength", self.params["strength"], self.selected_param == "strength")
-        self.draw_slider(26, "Noise / Glitch", self.params["noise"], self.selected_param == "noise")
-        self.draw_slider(27, "Cadence", self.params["cadence"], self.selected_param == "cadence")
+        for y, label, key in LIVE_SLIDERS[:4]:
+            self.draw_slider(y, label, self.params[key], self.selected_param == key, col1_x)
 
         self.stdscr.addnstr(23, col2_x, "CAMERA & MOTION", w - col2_x - 2, curses.A_BOLD)
-        self.draw_slider(24, "Zoom", self.params["zoom"], self.selected_param == "zoom")
-        self.draw_slider(25, "Pan X", self.params["panx"], self.selected_param == "panx")
-        self.draw_slider(26, "Pan Y", self.params["pany"], self.selected_param == "pany")
-        self.draw_slider(27, "Rotate Y", self.params["rotate"], self.selected_param == "rotate")
-        self.draw_slider(28, "Tilt (Z)", self.params["tilt"], self.selected_param == "tilt")
-        self.draw_slider(29, "FOV", self.params["fov"], self.selected_param == "fov")
+        for y, label, key in LIVE_SLIDERS[4:]:
+            self.draw_slider(y, label, self.params[key], self.selected_param == key, col2_x)
         self.stdscr.addnstr(30, col2_x, "Motion preset: [Tunnel Push]  (1 Static 2 Orbit 3 Chaos)", w - col2_x - 2)
 
         self.stdscr.addnstr(23, col3_x, "SOURCES / MACROS / MIDI", w - col3_x - 2, curses.A_BOLD)
-        src_lines = [
-            f"Vibe:     {' '.join(SOURCES)}",
-            f"Strength: {' '.join(SOURCES)}",
-            f"Zoom:     {' '.join(SOURCES)}",
-            f"Noise:    {' '.join(SOURCES)}",
-            "(TAB cycles • SPACE selects source)",
-            "",
-            "Beat macros:",
-        ]
-        for i, line in enumerate(src_lines):
+        for i, line in enumerate(LIVE_SOURCE_LINES):
             self.stdscr.addnstr(24 + i, col3_x, line, w - col3_x - 2)
         for idx, (name, on) in enumerate(self.macros):
             self.stdscr.addnstr(31 + idx, col3_x, f"  {idx+1} {name} ({'ON' if on else 'OFF'})", w - col3_x - 2)
@@ -734,7 +1139,7 @@ class DeforaTUI:
             "Controls: SPACE source • ←/→ adjust param • </> frame select • g generate/resume • r reconnect mediator",
             w - 2,
         )
-        self.stdscr.addnstr(
+        self.stdscr.addnstr_eol(
             h - 3,
             1,
             f"Status: Beat macros active • MIDI: {self.midi_device} • Deforum: {self.deforum_status()}",
@@ -742,7 +1147,7 @@ class DeforaTUI:
         )
 
     def draw_prompts(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         sub_labels = ["PROMPTS", "LORA", "CONTROLNET"]
         bar = "  ".join(f"[{t}]" if self.prompts_sub_tab == i else f" {t} " for i, t in enumerate(sub_labels))
         self.stdscr.addnstr(2, 1, f"PROMPTS  {bar}  (P to cycle)", w - 2, curses.A_BOLD)
@@ -754,7 +1159,7 @@ class DeforaTUI:
             self.draw_controlnet()
 
     def _draw_prompts_content(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(3, 1, "POSITIVE PROMPT A (FULL WIDTH)", w - 2, curses.A_BOLD)
         self.stdscr.addnstr(
             4,
@@ -786,28 +1191,25 @@ class DeforaTUI:
         )
 
     def draw_motion(self):
-        h, w = self.stdscr.getmaxyx()
-        self.stdscr.addnstr(2, 1, "CAMERA LIVE CONTROLS", w - 2, curses.A_BOLD)
-        rows = [
-            "Pan X:    0.10  [───○────────────]   Pan Y:    0.00  [────○──────────]",
-            "Zoom:     0.80  [███████────────]   Tilt:     0.00  [────○──────────]",
-            "Rotate H: 0.00  [────○──────────]   Rotate V: 0.00  [────○──────────]",
-            "Presets: [1 Static] [2 Orbit] [3 Tunnel Push] [4 Handheld] [5 Chaos]",
-        ]
-        for i, line in enumerate(rows):
-            self.stdscr.addnstr(3 + i, 1, line, w - 2)
-        self.stdscr.addnstr(8, 1, "MOTION STYLES", w - 2, curses.A_BOLD)
-        style_lines = [
-            "Saved styles: (none yet)",
-            "",
-            "Controls: S save current style • N name new style • 1-5 apply preset",
-        ]
-        for i, line in enumerate(style_lines):
-            self.stdscr.addnstr(9 + i, 1, line, w - 2)
+        h, w = self._layout.h, self._layout.w
+        if self._motion_pad is None:
+            self._motion_pad = self._build_motion_pad()
+        if self._motion_pad:
+            self._stage_pad(self._motion_pad, 0, 0, 2, 1, 2 + len(MOTION_PANEL) - 1, w - 2)
+        else:
+            for y, text, attr in MOTION_PANEL:
+                self.stdscr.addnstr(y, 1, text, w - 2, attr)
         self.stdscr.addnstr(h - 4, 1, "Hints: apply presets with number keys • SHIFT+F1..F4 save preset slots", w - 2)
 
+    def _build_motion_pad(self):
+        pad = self._new_pad(len(MOTION_PANEL), max(len(text) for _, text, _ in MOTION_PANEL) + 1)
+        if pad:
+            for row, (_, text, attr) in enumerate(MOTION_PANEL):
+                pad.addstr(row, 0, text, attr)
+        return pad
+
     def draw_modulation(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(2, 1, "LFO MODULATORS (multi-target)", w - 2, curses.A_BOLD)
         self.stdscr.addnstr(3, 1, "Each LFO can modulate multiple parameters simultaneously", w - 2)
         lfo_lines = [
@@ -834,7 +1236,7 @@ class DeforaTUI:
         self.stdscr.addnstr(h - 4, 1, "Hint: A tab for audio upload, BPM, beat macros, and audio→param mapping", w - 2)
 
     def draw_audio(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(2, 1, "AUDIO SOURCE", w - 2, curses.A_BOLD)
         self.stdscr.addnstr(3, 1, "Track: (no audio loaded)    BPM: [114.8]  [D detect] [K tap tempo]", w - 2)
         self.stdscr.addnstr(5, 1, "BEAT MACROS (per-beat modulation, each has enable toggle)", w - 2, curses.A_BOLD)
@@ -860,7 +1262,7 @@ class DeforaTUI:
         self.stdscr.addnstr(h - 4, 1, "Hint: MODULATION tab (F4) for LFO modulators; GENERATE tab (F7) for sequencer", w - 2)
 
     def draw_controlnet(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(2, 1, "SLOTS (CN1–CN5)", w - 2, curses.A_BOLD)
         self.stdscr.addnstr(3, 1, "[CN1] [CN2*] [CN3] [CN4] [CN5] (TAB to change)", w - 2)
         self.stdscr.addnstr(5, 1, "CN2 SETTINGS", w - 2, curses.A_BOLD)
@@ -884,7 +1286,7 @@ class DeforaTUI:
             self.stdscr.addnstr(14 + i, 1, line, w - 2)
 
     def draw_settings(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         sub_labels = ["ENGINE", "FORGE", "MIDI", "PRESETS"]
         bar = "  ".join(f"[{t}]" if self.settings_sub_tab == i else f" {t} " for i, t in enumerate(sub_labels))
         self.stdscr.addnstr(2, 1, f"SETTINGS  {bar}  (P to cycle)", w - 2, curses.A_BOLD)
@@ -898,7 +1300,7 @@ class DeforaTUI:
             self._draw_settings_presets()
 
     def _draw_settings_engine(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(3, 1, "ENGINE", w - 2, curses.A_BOLD)
         eng = [
             "Resolution: [1024x576]   FPS: [30]     Steps: [30]",
@@ -944,7 +1346,7 @@ class DeforaTUI:
         )
 
     def _draw_settings_midi(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(3, 1, "CONTROLLERS / MIDI", w - 2, curses.A_BOLD)
         ctrl = [
             "Devices:",
@@ -973,7 +1375,7 @@ class DeforaTUI:
             self.stdscr.addnstr(base + i, 1, line, w - 2)
 
     def _draw_settings_presets(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(3, 1, "PRESET MANAGEMENT", w - 2, curses.A_BOLD)
         presets = [
             "Saved presets:",
@@ -988,11 +1390,11 @@ class DeforaTUI:
             self.stdscr.addnstr(4 + i, 1, line, w - 2)
 
     def draw_forge_settings(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(3, 1, "FORGE CONNECTION", w - 2, curses.A_BOLD)
         forge = [
             f"Host: 192.168.2.101  Port: 7860",
-            f"Status: {'Connected' if self.bridge.connected else 'Disconnected'}",
+            f"Status: {'Connected   ' if self.bridge.connected else 'Disconnected'}",
             "",
             "MODEL:",
             f"  Current: (none loaded)",
@@ -1005,7 +1407,7 @@ class DeforaTUI:
             self.stdscr.addnstr(4 + i, 1, line, w - 2)
 
     def draw_generate(self):
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._layout.h, self._layout.w
         self.stdscr.addnstr(2, 1, "ANIMATION SEQUENCER", w - 2, curses.A_BOLD)
         seq = [
             "Duration: 8.0s  FPS: 24  Loop: [X]  Playhead: 0.00s",
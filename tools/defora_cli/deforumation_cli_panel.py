@@ -20,23 +20,56 @@ Bindings persist in deforumation_cli_bindings.json next to this file.
 from __future__ import annotations
 
 import argparse
-import asyncio
 import curses
 import json
 import os
-import pickle
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .mediator_client import MediatorClient
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+
+def _read_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which json.dumps writes and stdlib json reads back
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    # Writes stay on stdlib json so files keep its exact output (NaN, non-str keys, escaping).
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
-import websockets
 
 DEFAULT_MEDIATOR_HOST = os.getenv("DEFORUMATION_MEDIATOR_HOST", "localhost")
 DEFAULT_MEDIATOR_PORT = os.getenv("DEFORUMATION_MEDIATOR_PORT", "8766")
 CONFIG_PATH = Path(__file__).resolve().parent / "deforumation_cli_bindings.json"
 
-
-@dataclass
+# Key groups for the global navigation keys; curses.KEY_* are plain ints available at import.
+UP_KEYS = frozenset((curses.KEY_UP, ord("k")))
+DOWN_KEYS = frozenset((curses.KEY_DOWN, ord("j")))
+DEC_KEYS = frozenset((curses.KEY_LEFT, ord("-")))
+INC_KEYS = frozenset((curses.KEY_RIGHT, ord("+"), ord("=")))
+SPECIAL_KEY_LABELS = {
+    curses.KEY_LEFT: "LEFT",
+    curses.KEY_RIGHT: "RIGHT",
+    curses.KEY_UP: "UP",
+    curses.KEY_DOWN: "DOWN",
+    10: "ENTER",
+    27: "ESC",
+}
+
+
+@dataclass(slots=True)
 class ControlBinding:
     id: str
     label: str
@@ -50,10 +83,11 @@ class ControlBinding:
     value: float = 0.0
 
     def clamp(self, new_value: float) -> float:
-        if self.min_value is not None:
-            new_value = max(self.min_value, new_value)
-        if self.max_value is not None:
-            new_value = min(self.max_value, new_value)
+        lo, hi = self.min_value, self.max_value
+        if lo is not None and new_value < lo:
+            return lo
+        if hi is not None and new_value > hi:
+            return hi
         return new_value
 
     def formatted(self) -> str:
@@ -185,10 +219,9 @@ def load_cli_config(path: Path) -> Dict[str, object]:
     if not path.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
         data = default_bindings()
-        path.write_text(json.dumps(data, indent=2))
+        _write_json(path, data)
         return data
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _read_json(path)
 
 
 def save_cli_config(path: Path, mediator: Dict[str, str], bindings: List[ControlBinding]) -> None:
@@ -209,22 +242,15 @@ def save_cli_config(path: Path, mediator: Dict[str, str], bindings: List[Control
             for b in bindings
         ],
     }
-    path.write_text(json.dumps(blob, indent=2))
+    _write_json(path, blob)
 
 
 def key_to_label(key: int) -> Optional[str]:
     if key == -1:
         return None
-    special = {
-        curses.KEY_LEFT: "LEFT",
-        curses.KEY_RIGHT: "RIGHT",
-        curses.KEY_UP: "UP",
-        curses.KEY_DOWN: "DOWN",
-        10: "ENTER",
-        27: "ESC",
-    }
-    if key in special:
-        return special[key]
+    special = SPECIAL_KEY_LABELS.get(key)
+    if special is not None:
+        return special
     try:
         name = curses.keyname(key).decode("utf-8")
     except Exception:
@@ -238,45 +264,62 @@ def normalize_label(label: str) -> str:
     return label.lower()
 
 
-class MediatorClient:
-    """Tiny helper around the mediator websocket protocol."""
-
-    def __init__(self, host: str, port: str, timeout: float = 10.0):
-        self.uri = f"ws://{host}:{port}"
-        self.timeout = timeout
-
-    async def _send_async(self, payload):
-        async with websockets.connect(self.uri) as websocket:
-            await asyncio.wait_for(websocket.send(pickle.dumps(payload)), timeout=self.timeout)
-            reply = await asyncio.wait_for(websocket.recv(), timeout=self.timeout)
-            try:
-                decoded = pickle.loads(reply)
-            except Exception:
-                return reply
-            if isinstance(decoded, list):
-                if len(decoded) == 1:
-                    return decoded[0]
-                return decoded
-            return decoded
-
-    def send(self, payload):
-        return asyncio.run(self._send_async(payload))
-
-    def read(self, param: str):
-        return self.send([0, param, 0])
-
-    def write(self, param: str, value):
-        return self.send([1, param, value])
-
-
 class DeforumControlPanel:
-    def __init__(self, stdscr, mediator_host: str, mediator_port: str, controls: List[ControlBinding]):
+    def __init__(
+        self,
+        stdscr,
+        mediator_host: str,
+        mediator_port: str,
+        controls: List[ControlBinding],
+        mediator: Optional[MediatorClient] = None,
+    ):
         self.stdscr = stdscr
         self.controls = controls
         self.selected_index = 0
+        self._dirty = True  # redraw only after something visible changed
         self.status = "Connecting to mediator..."
-        self.mediator = MediatorClient(mediator_host, mediator_port)
+        # One kept-open websocket for the whole session instead of a handshake per keypress.
+        self.mediator = mediator or MediatorClient(mediator_host, mediator_port)
         self.mediator_cfg = {"host": mediator_host, "port": mediator_port}
+        self._hotkeys: Dict[str, Tuple[ControlBinding, float]] = {}
+        self._hotkey_labels: Dict[str, str] = {}
+        self._line_cache: Dict[str, Tuple[Tuple[float, bool], str]] = {}
+        self._build_hotkeys()
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, text: str) -> None:
+        self._status = text
+        self._dirty = True
+
+    def _build_hotkeys(self) -> None:
+        """Map each normalized hotkey to (control, signed step); the first binding of a key wins."""
+        hotkeys: Dict[str, Tuple[ControlBinding, float]] = {}
+        for ctrl in self.controls:
+            for key in ctrl.inc_keys:
+                hotkeys.setdefault(normalize_label(key), (ctrl, ctrl.step))
+            for key in ctrl.dec_keys:
+                hotkeys.setdefault(normalize_label(key), (ctrl, -ctrl.step))
+        self._hotkeys = hotkeys
+        self._hotkey_labels = {
+            ctrl.id: "/".join(ctrl.dec_keys or ["-"]) + " | " + "/".join(ctrl.inc_keys or ["+"])
+            for ctrl in self.controls
+        }
+        self._line_cache.clear()
+
+    def _control_line(self, ctrl: ControlBinding, selected: bool) -> str:
+        state = (ctrl.value, selected)
+        cached = self._line_cache.get(ctrl.id)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        prefix = "> " if selected else "  "
+        hotkeys = self._hotkey_labels[ctrl.id]
+        line = f"{prefix}{ctrl.label:<14} {ctrl.formatted():>8}  [{hotkeys:<12}]  ({ctrl.param})"
+        self._line_cache[ctrl.id] = (state, line)
+        return line
 
     def run(self) -> None:
         curses.curs_set(0)
@@ -284,29 +327,40 @@ class DeforumControlPanel:
         self.stdscr.timeout(100)
         self.bootstrap_flags()
         self.refresh_values()
-        while True:
-            self.draw()
-            key = self.stdscr.getch()
-            if key == -1:
-                continue
-            label = key_to_label(key)
-            if label == "q":
-                break
-            handled = self.handle_global_input(key, label)
-            if not handled:
-                self.handle_binding_input(label)
+        try:
+            while True:
+                if self._dirty:
+                    self.draw()
+                key = self.stdscr.getch()
+                if key == -1:
+                    continue
+                if key == curses.KEY_RESIZE:
+                    self._dirty = True
+                    continue
+                label = key_to_label(key)
+                if label == "q":
+                    break
+                handled = self.handle_global_input(key, label)
+                if not handled:
+                    self.handle_binding_input(label)
+        finally:
+            close = getattr(self.mediator, "close", None)
+            if close is not None:
+                close()
 
     def handle_global_input(self, key: int, label: Optional[str]) -> bool:
-        if key in (curses.KEY_UP, ord("k")):
+        if key in UP_KEYS:
             self.selected_index = (self.selected_index - 1) % len(self.controls)
+            self._dirty = True
             return True
-        if key in (curses.KEY_DOWN, ord("j")):
+        if key in DOWN_KEYS:
             self.selected_index = (self.selected_index + 1) % len(self.controls)
+            self._dirty = True
             return True
-        if key in (curses.KEY_LEFT, ord("-")):
+        if key in DEC_KEYS:
             self.bump_selected(-1)
             return True
-        if key in (curses.KEY_RIGHT, ord("+"), ord("=")):
+        if key in INC_KEYS:
             self.bump_selected(1)
             return True
         if label == "r":
@@ -320,31 +374,51 @@ class DeforumControlPanel:
     def handle_binding_input(self, label: Optional[str]) -> None:
         if label is None:
             return
-        lower = normalize_label(label)
-        for ctrl in self.controls:
-            if lower in [normalize_label(k) for k in ctrl.inc_keys]:
-                self.update_control(ctrl, ctrl.step)
-                return
-            if lower in [normalize_label(k) for k in ctrl.dec_keys]:
-                self.update_control(ctrl, -ctrl.step)
-                return
+        hit = self._hotkeys.get(normalize_label(label))
+        if hit is not None:
+            self.update_control(*hit)
 
     def bump_selected(self, direction: int) -> None:
         control = self.controls[self.selected_index]
         self.update_control(control, control.step * direction)
 
     def update_control(self, control: ControlBinding, delta: float) -> None:
+        param = control.param
+        value = control.clamp(control.value + delta)
+        if value == control.value:
+            # Pinned at a bound (e.g. key-repeat past max): nothing to send.
+            self.status = f"{control.label} at limit ({control.formatted()})"
+            return
         try:
-            control.value = control.clamp(control.value + delta)
-            self.mediator.write(control.param, control.value)
-            self.status = f"Set {control.label} ({control.param}) -> {control.formatted()}"
+            control.value = value
+            self.mediator.write(param, value)
+            self.status = f"Set {control.label} ({param}) -> {control.formatted()}"
         except Exception as exc:
-            self.status = f"Failed to send {control.param}: {exc}"
+            self.status = f"Failed to send {param}: {exc}"
+
+    def _read_many(self, params: List[str]) -> List[object]:
+        read_many = getattr(self.mediator, "read_many", None)
+        if read_many is not None:
+            return read_many(params)
+        return [self.mediator.read(param) for param in params]
+
+    def _write_many(self, pairs: List[Tuple[str, object]]) -> None:
+        write_many = getattr(self.mediator, "write_many", None)
+        if write_many is not None:
+            write_many(pairs)
+            return
+        for param, value in pairs:
+            self.mediator.write(param, value)
 
     def refresh_values(self) -> None:
-        for ctrl in self.controls:
+        # One pipelined round-trip for all controls instead of a read per control.
+        try:
+            values = self._read_many([ctrl.param for ctrl in self.controls])
+        except Exception as exc:
+            self.status = f"Could not read values: {exc}"
+            return
+        for ctrl, new_val in zip(self.controls, values):
             try:
-                new_val = self.mediator.read(ctrl.param)
                 if new_val is not None:
                     ctrl.value = float(new_val)
             except Exception as exc:
@@ -360,14 +434,13 @@ class DeforumControlPanel:
         hint = "Arrows/-/+: adjust selection | Hotkeys column works anytime"
         self.stdscr.addnstr(1, 0, hint, width - 1)
         for idx, ctrl in enumerate(self.controls):
-            prefix = "> " if idx == self.selected_index else "  "
-            hotkeys = "/".join(ctrl.dec_keys or ["-"]) + " | " + "/".join(ctrl.inc_keys or ["+"])
-            line = f"{prefix}{ctrl.label:<14} {ctrl.formatted():>8}  [{hotkeys:<12}]  ({ctrl.param})"
-            attr = curses.A_REVERSE if idx == self.selected_index else curses.A_NORMAL
-            self.stdscr.addnstr(3 + idx, 0, line, width - 1, attr)
+            selected = idx == self.selected_index
+            attr = curses.A_REVERSE if selected else curses.A_NORMAL
+            self.stdscr.addnstr(3 + idx, 0, self._control_line(ctrl, selected), width - 1, attr)
         self.stdscr.hline(height - 2, 0, "-", width - 1)
         self.stdscr.addnstr(height - 1, 0, self.status[: width - 1], width - 1)
         self.stdscr.refresh()
+        self._dirty = False
 
     def rebind_selected(self) -> None:
         ctrl = self.controls[self.selected_index]
@@ -381,6 +454,7 @@ class DeforumControlPanel:
             return
         ctrl.inc_keys = [inc]
         ctrl.dec_keys = [dec]
+        self._build_hotkeys()
         save_cli_config(CONFIG_PATH, self.mediator_cfg, self.controls)
         self.status = f"Updated bindings for {ctrl.label} (+:{inc} / -:{dec})"
 
@@ -408,11 +482,10 @@ class DeforumControlPanel:
             "should_use_deforumation_fov": 1,
             "should_use_deforumation_tilt": 1,
         }
-        for key, value in flags.items():
-            try:
-                self.mediator.write(key, value)
-            except Exception:
-                pass
+        try:
+            self._write_many(list(flags.items()))
+        except Exception:
+            pass
 
 
 def build_controls(config_blob: Dict[str, object]) -> Tuple[Dict[str, str], List[ControlBinding]]:
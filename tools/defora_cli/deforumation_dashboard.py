@@ -18,12 +18,34 @@ import curses
 import json
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .mediator_client import MediatorClient
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+
+def _read_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which json.dumps writes and stdlib json reads back
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    # Writes stay on stdlib json so files keep its exact output (NaN, non-str keys, escaping).
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
 DEFAULT_CONFIG_PATH = Path("defora_data/DeforumationSendConfig.json")
 DEFAULT_AUDIO_OUTPUT = Path("audio_modulation.json")
 DEFAULT_MAPPING = Path()  # no default mapping; user should set explicitly
@@ -36,6 +58,17 @@ TAB_CONTROL = "CONTROLNET"
 TAB_AUDIO = "AUDIO SYNC"
 TAB_SETTINGS = "SETTINGS"
 
+# Key groups for the dashboard loop, built once rather than as tuples per keypress.
+QUIT_KEYS = frozenset((ord("q"), 27))
+PREV_TAB_KEYS = frozenset((curses.KEY_LEFT, ord("h")))
+NEXT_TAB_KEYS = frozenset((curses.KEY_RIGHT, ord("l")))
+UP_KEYS = frozenset((curses.KEY_UP, ord("k")))
+DOWN_KEYS = frozenset((curses.KEY_DOWN, ord("j")))
+ENTER_KEYS = frozenset((curses.KEY_ENTER, ord("\n"), ord("\r")))
+AUDIO_POLL_MS = 200
+# Seconds to wait for the audio helper to exit after SIGTERM (and for its stderr to drain).
+AUDIO_STOP_TIMEOUT = 2.0
+
 
 # label, key, type
 PROMPT_FIELDS: List[Tuple[str, str, type]] = [
@@ -105,6 +138,14 @@ TAB_FIELDS: Dict[str, List[Tuple[str, str, type]]] = {
     TAB_SETTINGS: SETTINGS_FIELDS,
 }
 
+# Tab order, name -> position, and the rendered tab bar for each active tab; built once at import.
+_TAB_NAMES = tuple(TAB_FIELDS)
+_TAB_INDEX = {name: idx for idx, name in enumerate(_TAB_NAMES)}
+_TAB_BARS = {
+    active: " | ".join(f"[{name}]" if name == active else f" {name} " for name in _TAB_NAMES)
+    for active in _TAB_NAMES
+}
+
 SENDABLE_KEYS = {
     TAB_PROMPTS: ["strength", "cfg", "cadence", "noise_multiplier"],
     TAB_MOTIONS: ["translation_x", "translation_y", "translation_z", "rotation_x", "rotation_y", "rotation_z", "fov"],
@@ -132,19 +173,25 @@ class DashboardState:
     status: str = ""
     tab: str = TAB_PROMPTS
     cursor: Dict[str, int] = field(default_factory=lambda: {t: 0 for t in TAB_FIELDS})
+    # Kept open across `m` presses; created on first send.
+    client: Optional[MediatorClient] = field(default=None, repr=False, compare=False)
+    # Running audio helper and its most recent stderr line (written by the pump thread).
+    audio_proc: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+    audio_pump: Optional[threading.Thread] = field(default=None, repr=False, compare=False)
+    audio_last_line: str = ""
+    # tab -> SENDABLE_KEYS present in data; reset whenever data gains keys or is reloaded.
+    sendable_cache: Dict[str, List[str]] = field(default_factory=dict, repr=False, compare=False)
 
 
 def load_config(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _read_json(path)
 
 
 def save_config(path: Path, data: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+    _write_json(path, data)
 
 
 def preset_path(name: str) -> Path:
@@ -181,11 +228,7 @@ def draw_ui(stdscr, state: DashboardState) -> None:
     stdscr.addnstr(0, 0, "Deforumation Dashboard", w - 1, curses.A_BOLD)
 
     # Tabs bar
-    tab_line = []
-    for name in TAB_FIELDS:
-        decorated = f"[{name}]" if name == state.tab else f" {name} "
-        tab_line.append(decorated)
-    stdscr.addnstr(1, 0, " | ".join(tab_line)[: w - 1], w - 1, curses.A_REVERSE)
+    stdscr.addnstr(1, 0, _TAB_BARS[state.tab], w - 1, curses.A_REVERSE)
 
     fields = TAB_FIELDS[state.tab]
     cursor = state.cursor.get(state.tab, 0)
@@ -209,6 +252,8 @@ def draw_ui(stdscr, state: DashboardState) -> None:
 
 
 def edit_field(stdscr, label: str, current: Any, typ: type) -> Any:
+    # The main loop polls with a timeout while the audio helper runs; a prompt must block.
+    stdscr.timeout(-1)
     curses.echo()
     stdscr.addstr(label + " (current: " + str(current) + "): ")
     stdscr.clrtoeol()
@@ -230,20 +275,36 @@ def toggle_field(value: Any) -> Any:
     return value
 
 
+def sendable_keys(state: DashboardState) -> List[str]:
+    keys = state.sendable_cache.get(state.tab)
+    if keys is None:
+        keys = state.sendable_cache[state.tab] = [k for k in SENDABLE_KEYS.get(state.tab, []) if k in state.data]
+    return keys
+
+
 def send_to_mediator(state: DashboardState, keys: List[str]) -> str:
-    try:
-        client = MediatorClient(state.mediator_host, state.mediator_port)
-    except Exception as exc:  # pragma: no cover - runtime only
-        return f"Mediator unavailable: {exc}"
+    if state.client is None:
+        try:
+            state.client = MediatorClient(state.mediator_host, state.mediator_port)
+        except Exception as exc:  # pragma: no cover - runtime only
+            return f"Mediator unavailable: {exc}"
+    client = state.client
+    pairs = [(key, state.data[key]) for key in keys if key in state.data]
     sent = []
-    for key in keys:
-        if key not in state.data:
-            continue
+    write_many = getattr(client, "write_many", None)
+    if write_many is not None and pairs:
         try:
-            client.write(key, state.data[key])
-            sent.append(key)
-        except Exception:
-            continue
+            write_many(pairs)
+            sent = [key for key, _ in pairs]
+        except Exception as exc:
+            return f"Mediator write failed: {exc}"
+    else:
+        for key, value in pairs:
+            try:
+                client.write(key, value)
+                sent.append(key)
+            except Exception:
+                continue
     return f"Sent to mediator: {', '.join(sent) if sent else 'nothing'}"
 
 
@@ -274,61 +335,133 @@ def run_audio_helper(state: DashboardState) -> str:
         cmd.append("--live")
         if output:
             cmd.extend(["--output", output])
+    if state.audio_proc is not None:
+        return "Audio helper already running."
+    # Run in the background so the dashboard stays responsive; stderr is streamed
+    # into the status line instead of being buffered until exit.
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if result.returncode == 0:
-            return "Audio helper finished."
-        return f"Audio helper failed ({result.returncode}): {result.stderr.strip() or result.stdout.strip()}"
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, bufsize=1)
     except Exception as exc:  # pragma: no cover - runtime only
         return f"Audio helper error: {exc}"
+    state.audio_proc = proc
+    state.audio_last_line = ""
+    state.audio_pump = threading.Thread(target=_pump_audio_stderr, args=(proc, state), daemon=True)
+    state.audio_pump.start()
+    return "Audio helper started."
+
+
+def _pump_audio_stderr(proc: subprocess.Popen, state: DashboardState) -> None:
+    for line in proc.stderr:
+        line = line.strip()
+        if line:
+            state.audio_last_line = line
+            if state.audio_proc is proc:
+                state.status = f"Audio helper: {line}"
+
+
+def poll_audio_helper(state: DashboardState) -> bool:
+    """Finalize the status once the background audio helper exits; True if it just did."""
+    proc = state.audio_proc
+    if proc is None:
+        return False
+    returncode = proc.poll()
+    if returncode is None:
+        return False
+    state.audio_proc = None
+    # The pump may still hold the final stderr lines (usually the actual error).
+    if state.audio_pump is not None:
+        state.audio_pump.join(AUDIO_STOP_TIMEOUT)
+        state.audio_pump = None
+    if returncode == 0:
+        state.status = "Audio helper finished."
+    else:
+        state.status = f"Audio helper failed ({returncode}): {state.audio_last_line}"
+    return True
+
+
+def stop_audio_helper(state: DashboardState) -> None:
+    """Terminate a running audio helper, killing it if it ignores SIGTERM."""
+    proc = state.audio_proc
+    if proc is None:
+        return
+    state.audio_proc = None
+    state.audio_pump = None
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=AUDIO_STOP_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
 
 
 def dashboard(stdscr, state: DashboardState) -> None:
     curses.curs_set(0)
+    try:
+        _dashboard_loop(stdscr, state)
+    finally:
+        stop_audio_helper(state)
+        if state.client is not None:
+            state.client.close()
+            state.client = None
+
+
+def _dashboard_loop(stdscr, state: DashboardState) -> None:
+    dirty = True
+    drawn_status = None
     while True:
-        draw_ui(stdscr, state)
+        if dirty:
+            draw_ui(stdscr, state)
+            drawn_status = state.status
+        # Block on input unless an audio helper is running, whose progress we poll for.
+        stdscr.timeout(AUDIO_POLL_MS if state.audio_proc is not None else -1)
         key = stdscr.getch()
+        if key == -1:
+            dirty = poll_audio_helper(state) or state.status != drawn_status
+            continue
         fields = TAB_FIELDS[state.tab]
         cursor = state.cursor[state.tab]
+        dirty = True
 
-        if key in (ord("q"), 27):
+        if key in QUIT_KEYS:
             break
-        elif key in (curses.KEY_LEFT, ord("h")):
-            tab_names = list(TAB_FIELDS.keys())
-            idx = tab_names.index(state.tab)
-            state.tab = tab_names[(idx - 1) % len(tab_names)]
-        elif key in (curses.KEY_RIGHT, ord("l")):
-            tab_names = list(TAB_FIELDS.keys())
-            idx = tab_names.index(state.tab)
-            state.tab = tab_names[(idx + 1) % len(tab_names)]
-        elif key in (curses.KEY_UP, ord("k")):
+        elif key in PREV_TAB_KEYS:
+            state.tab = _TAB_NAMES[(_TAB_INDEX[state.tab] - 1) % len(_TAB_NAMES)]
+        elif key in NEXT_TAB_KEYS:
+            state.tab = _TAB_NAMES[(_TAB_INDEX[state.tab] + 1) % len(_TAB_NAMES)]
+        elif key in UP_KEYS:
             state.cursor[state.tab] = (cursor - 1) % len(fields)
-        elif key in (curses.KEY_DOWN, ord("j")):
+        elif key in DOWN_KEYS:
             state.cursor[state.tab] = (cursor + 1) % len(fields)
-        elif key in (ord(" "),):
+        elif key == ord(" "):
             label, cfg_key, typ = fields[cursor]
             if typ is bool:
                 state.data[cfg_key] = toggle_field(state.data.get(cfg_key, False))
+                state.sendable_cache.clear()
                 state.status = f"Toggled {label}"
-        elif key in (curses.KEY_ENTER, ord("\n"), ord("\r")):
+        elif key in ENTER_KEYS:
             label, cfg_key, typ = fields[cursor]
             new_val = edit_field(stdscr, label, state.data.get(cfg_key), typ)
             state.data[cfg_key] = new_val
+            state.sendable_cache.clear()
             state.status = f"Updated {label}"
         elif key == ord("s"):
             save_config(state.config_path, state.data)
             state.status = f"Saved {state.config_path}"
         elif key == ord("r"):
             state.data = ensure_defaults(load_config(state.config_path))
+            state.sendable_cache.clear()
             state.status = "Reloaded config"
         elif key == ord("m"):
-            keys = SENDABLE_KEYS.get(state.tab, [])
-            state.status = send_to_mediator(state, keys)
+            state.status = send_to_mediator(state, sendable_keys(state))
         elif key == ord("g"):
             if state.tab == TAB_AUDIO:
                 state.status = run_audio_helper(state)
             else:
                 state.status = "Audio helper: switch to AUDIO SYNC tab"
+        elif key != curses.KEY_RESIZE:
+            dirty = False  # unbound key: nothing on screen changed
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
@@ -6,17 +6,62 @@ The real mediator uses a websocket where messages are pickled triples:
   [should_write:int, param:str, value:any]
 Reads expect [0, param, 0]; writes expect [1, param, value].
 Responses are pickled; if the payload is a list of length 1 the single item is returned.
+
+The websocket is opened lazily on first use and kept open across calls; a call
+that fails on a reused connection reconnects once and retries.
+
+protocol="json" (orjson when installed) or protocol="msgpack" (needs the
+msgpack package) send the same triplets in that format for mediators that
+accept it, such as mediator_server; pickle stays the default because that is
+what the upstream Deforumation mediator speaks.
+
+subscribe() asks mediator_server/mediator_mock to push value changes
+([3, [param, ...], 0]) instead of being polled; the upstream mediator has no
+such opcode.
 """
 from __future__ import annotations
 
-import asyncio
+import functools
+import importlib.util
+import json
 import pickle
-from typing import Any, Callable, Optional
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # asyncio and websockets are imported on first connect to keep CLI startup fast
+    import asyncio
+
+try:
+    import orjson  # type: ignore
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
 
 try:
-    import websockets  # type: ignore
-except Exception:  # pragma: no cover - optional runtime dependency
-    websockets = None  # type: ignore
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional wire format
+    msgpack = None  # type: ignore
+
+# Protocol 5 rather than the interpreter default (4): cheaper framing for the
+# tiny triplets and out-of-band buffer support should binary values appear.
+_pickle_dumps = functools.partial(pickle.dumps, protocol=5)
+
+CODECS = {
+    "pickle": (_pickle_dumps, pickle.loads),
+    "json": (_json_dumps, _json_loads),
+}
+if msgpack is not None:
+    CODECS["msgpack"] = (
+        functools.partial(msgpack.packb, use_bin_type=True),
+        functools.partial(msgpack.unpackb, raw=False),
+    )
 
 
 class MediatorClient:
@@ -26,32 +71,138 @@ class MediatorClient:
         port: str,
         timeout: float = 10.0,
         connector: Optional[Callable[..., Any]] = None,
+        connect_timeout: Optional[float] = None,
+        protocol: str = "pickle",
     ):
+        if protocol not in CODECS:
+            raise ValueError(f"unknown mediator protocol {protocol!r} (expected one of {sorted(CODECS)})")
         self.host = host
         self.port = port
         self.timeout = timeout
+        self.connect_timeout = timeout if connect_timeout is None else connect_timeout
         self.uri = f"ws://{host}:{port}"
-        self.connector = connector or (websockets and websockets.connect)
-        if self.connector is None:
+        self.protocol = protocol
+        self._dumps, self._loads = CODECS[protocol]
+        if connector is None and importlib.util.find_spec("websockets") is None:
             raise RuntimeError("websockets is not available and no connector was provided")
+        self.connector = connector
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cm = None
+        self._ws = None
+        self._lock = threading.Lock()
+
+    async def _connect_async(self):
+        import asyncio
+
+        if self._ws is None:
+            if self.connector is None:
+                import websockets  # type: ignore
+
+                self.connector = websockets.connect
+            cm = self.connector(self.uri)
+            self._ws = await asyncio.wait_for(cm.__aenter__(), timeout=self.connect_timeout)
+            self._cm = cm
+        return self._ws
 
-    async def _send_async(self, payload):
-        async with self.connector(self.uri) as websocket:
-            await asyncio.wait_for(websocket.send(pickle.dumps(payload)), timeout=self.timeout)
-            reply = await asyncio.wait_for(websocket.recv(), timeout=self.timeout)
+    async def _disconnect_async(self):
+        cm, self._cm, self._ws = self._cm, None, None
+        if cm is not None:
             try:
-                decoded = pickle.loads(reply)
+                await cm.__aexit__(None, None, None)
             except Exception:
-                return reply
-            if isinstance(decoded, list) and len(decoded) == 1:
-                return decoded[0]
-            return decoded
+                pass
+
+    def _decode(self, reply):
+        try:
+            decoded = self._loads(reply)
+        except Exception:
+            return reply
+        if isinstance(decoded, list) and len(decoded) == 1:
+            return decoded[0]
+        return decoded
+
+    async def _exchange_async(self, payloads: List[list]) -> List[Any]:
+        # Pipelined: every request goes out before the first reply is awaited,
+        # so N messages cost one round-trip instead of N.
+        import asyncio
+
+        websocket = await self._connect_async()
+        for payload in payloads:
+            await asyncio.wait_for(websocket.send(self._dumps(payload)), timeout=self.timeout)
+        replies = []
+        for _ in payloads:
+            replies.append(self._decode(await asyncio.wait_for(websocket.recv(), timeout=self.timeout)))
+        return replies
+
+    async def _send_async(self, payloads: List[list]) -> List[Any]:
+        reused = self._ws is not None
+        try:
+            return await self._exchange_async(payloads)
+        except Exception:
+            await self._disconnect_async()
+            if not reused:
+                raise
+        # The kept-open socket went stale (mediator restart, idle drop); retry on a fresh one.
+        try:
+            return await self._exchange_async(payloads)
+        except Exception:
+            await self._disconnect_async()
+            raise
+
+    def _run(self, coro):
+        import asyncio
+
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+
+    def ensure_connected(self) -> None:
+        """Open the mediator connection now instead of on the first read/write."""
+        self._run(self._connect_async())
+
+    def close(self) -> None:
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._run(self._disconnect_async())
+        with self._lock:
+            self._loop.close()
 
     def send(self, payload):
-        return asyncio.run(self._send_async(payload))
+        return self._run(self._send_async([payload]))[0]
+
+    def send_many(self, payloads: List[list]) -> List[Any]:
+        if not payloads:
+            return []
+        return self._run(self._send_async(payloads))
 
     def read(self, param: str):
         return self.send([0, param, 0])
 
     def write(self, param: str, value: Any):
         return self.send([1, param, value])
+
+    def read_many(self, params: Iterable[str]) -> List[Any]:
+        return self.send_many([[0, param, 0] for param in params])
+
+    def write_many(self, pairs: Iterable[Tuple[str, Any]]) -> List[Any]:
+        return self.send_many([[1, param, value] for param, value in pairs])
+
+    async def subscribe(self, params: Iterable[str]) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield (param, value) as the mediator pushes them: current values first, then changes.
+
+        Runs on the caller's event loop over its own connection, separate from
+        the request/reply socket used by read/write.
+        """
+        connector = self.connector
+        if connector is None:
+            import websockets  # type: ignore
+
+            connector = websockets.connect
+        async with connector(self.uri) as websocket:
+            await websocket.send(self._dumps([3, list(params), 0]))
+            while True:
+                message = self._loads(await websocket.recv())
+                if not isinstance(message, (list, tuple)) or len(message) != 2 or message[0] == "error":
+                    raise RuntimeError(f"mediator refused subscription: {message!r}")
+                yield message[0], message[1]
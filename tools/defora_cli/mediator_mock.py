@@ -5,6 +5,14 @@ Tiny in-memory mediator server for demos/tests.
 Speaks the same pickled triplet protocol expected by MediatorClient:
   [0, param, 0] → returns [value] (default 0)
   [1, param, value] → stores the value and echoes [param, value]
+  [3, [param, ...], 0] → pushes [param, value] for each param now and on every change
+JSON and msgpack triplets (MediatorClient protocol="json"/"msgpack") are
+detected from the first byte and answered in kind.
+
+The protocol handling is mediator_server's; this serves it on a single port
+configured from the environment, starting from the mock's own small STATE
+(cfg, strength, noise) instead of the server's defaults. Run it with
+`python -m defora_cli.mediator_mock` or directly as a script.
 
 This is intentionally minimal: no auth, persistence, or schema checks.
 """
@@ -12,50 +20,36 @@ from __future__ import annotations
 
 import asyncio
 import os
-import pickle
-from typing import Any, Dict
 
 import websockets
-from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
+
+try:
+    from . import mediator_server
+except ImportError:  # run as a script: tools/defora_cli/mediator_mock.py
+    import mediator_server  # type: ignore
 
 HOST = os.getenv("MEDIATOR_HOST", "0.0.0.0")
 PORT = int(os.getenv("MEDIATOR_PORT", "8766"))
 
-STATE: Dict[str, Any] = {
+STATE = {
     "cfg": 7.5,
     "strength": 0.6,
     "noise": 0.15,
 }
 
 
-async def handle_connection(websocket):
-    while True:
-        try:
-            raw = await websocket.recv()
-        except (ConnectionClosedOK, ConnectionClosedError):
-            break
-
-        try:
-            payload = pickle.loads(raw)
-        except Exception as exc:
-            await websocket.send(pickle.dumps(["error", f"unpicklable: {exc}"]))
-            continue
-
-        if not isinstance(payload, list) or len(payload) != 3:
-            await websocket.send(pickle.dumps(["error", "expected triplet [rw,param,val]"]))
-            continue
-
-        mode, param, value = payload
-        if mode == 0:  # read
-            await websocket.send(pickle.dumps([STATE.get(param, 0)]))
-        else:  # write
-            STATE[param] = value
-            await websocket.send(pickle.dumps([param, value]))
-
-
 async def main():
+    # The shared handler reads and writes mediator_server.STATE; seed it with the mock's values.
+    mediator_server.STATE.clear()
+    mediator_server.STATE.update(STATE)
     print(f"[mediator-mock] listening on {HOST}:{PORT}")
-    async with websockets.serve(handle_connection, HOST, PORT, ping_interval=None):
+    async with websockets.serve(
+        lambda ws: mediator_server.handle_connection(ws, "mock"),
+        HOST,
+        PORT,
+        ping_interval=None,
+        max_size=mediator_server.MAX_MESSAGE_BYTES,
+    ):
         await asyncio.Future()  # run forever
 
 
@@ -5,6 +5,14 @@ Minimal Defora mediator server (self-contained).
 Implements the pickled triplet protocol expected by Deforumation clients:
   [0, param, 0] -> returns [value]
   [1, param, value] -> stores value and returns [param, value]
+  [3, [param, ...] or param, 0] -> subscribes: the connection then receives
+      [param, value] for each listed param now and again whenever a write
+      changes it (no further requests are read on that connection)
+
+Frames that start with "[" are JSON triplets and frames that start with a
+msgpack array header are msgpack (MediatorClient's protocol="json"/"msgpack");
+each is answered in its own format. Everything else is unpickled, allowing
+only builtin types and messages up to MAX_MESSAGE_BYTES.
 
 This is a lightweight, in-memory mediator that can bind both the Deforum
 port (default 8765) and the Deforumation port (default 8766).
@@ -13,8 +21,11 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import io
+import json
 import pickle
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 import websockets
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
@@ -33,6 +44,74 @@ STATE: Dict[str, Any] = {
 }
 
 
+try:
+    import msgpack  # type: ignore
+except ImportError:  # msgpack frames are only understood when it is installed
+    msgpack = None  # type: ignore
+
+
+_pickle_dumps = functools.partial(pickle.dumps, protocol=5)
+# Triplets are a few dozen bytes; anything this large is not a mediator message.
+MAX_MESSAGE_BYTES = 64 * 1024
+
+
+class _TripletUnpickler(pickle.Unpickler):
+    """Unpickler limited to builtin scalars and containers (no class or callable lookups)."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"blocked: {module}.{name}")
+
+
+def _pickle_loads(data: bytes) -> Any:
+    return _TripletUnpickler(io.BytesIO(data)).load()
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _codec(raw) -> Tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    """Pick (loads, dumps) from the frame's first byte; replies use the sender's format."""
+    head = raw[:1]
+    if head in ("[", b"["):
+        return json.loads, _json_dumps
+    if msgpack is not None and isinstance(head, bytes) and head and 0x90 <= head[0] <= 0x9F:
+        return (lambda data: msgpack.unpackb(data, raw=False)), (lambda obj: msgpack.packb(obj, use_bin_type=True))
+    return _pickle_loads, _pickle_dumps
+
+
+# Live subscriptions: queue -> params that connection asked to be pushed.
+SUBSCRIBERS: Dict[asyncio.Queue, frozenset] = {}
+
+
+def _publish(param: str, value: Any) -> None:
+    for queue, params in SUBSCRIBERS.items():
+        if param in params:
+            queue.put_nowait((param, value))
+
+
+async def _serve_subscription(websocket, params: frozenset, dumps) -> None:
+    queue: asyncio.Queue = asyncio.Queue()
+    SUBSCRIBERS[queue] = params
+    # Nothing is read from a subscriber, so watch for the close explicitly.
+    closed = asyncio.ensure_future(websocket.wait_closed())
+    try:
+        for param in params:
+            await websocket.send(dumps([param, STATE.get(param, 0)]))
+        while True:
+            change = asyncio.ensure_future(queue.get())
+            await asyncio.wait((change, closed), return_when=asyncio.FIRST_COMPLETED)
+            if not change.done():
+                change.cancel()
+                break
+            await websocket.send(dumps(list(change.result())))
+    except (ConnectionClosedOK, ConnectionClosedError):
+        pass
+    finally:
+        closed.cancel()
+        SUBSCRIBERS.pop(queue, None)
+
+
 async def handle_connection(websocket, label: str) -> None:
     while True:
         try:
@@ -40,22 +119,38 @@ async def handle_connection(websocket, label: str) -> None:
         except (ConnectionClosedOK, ConnectionClosedError):
             break
 
+        loads, dumps = _codec(raw)
+        if len(raw) > MAX_MESSAGE_BYTES:
+            await websocket.send(dumps(["error", f"message exceeds {MAX_MESSAGE_BYTES} bytes"]))
+            continue
         try:
-            payload = pickle.loads(raw)
+            payload = loads(raw)
         except Exception as exc:
-            await websocket.send(pickle.dumps(["error", f"unpicklable: {exc}"]))
+            await websocket.send(dumps(["error", f"undecodable: {exc}"]))
             continue
 
         if not isinstance(payload, (list, tuple)) or len(payload) != 3:
-            await websocket.send(pickle.dumps(["error", "expected triplet [rw,param,val]"]))
+            await websocket.send(dumps(["error", "expected triplet [rw,param,val]"]))
             continue
 
         mode, param, value = payload
         if mode == 0:  # read
-            await websocket.send(pickle.dumps([STATE.get(param, 0)]))
+            await websocket.send(dumps([STATE.get(param, 0)]))
+        elif mode == 3:  # subscribe; this connection is push-only from here on
+            try:
+                # A bare name is one param, not the set of its characters.
+                params = frozenset((param,) if isinstance(param, str) else param)
+            except TypeError:
+                await websocket.send(dumps(["error", "subscribe expects a list of params"]))
+                continue
+            await _serve_subscription(websocket, params, dumps)
+            break
         else:  # write
+            changed = STATE.get(param) != value
             STATE[param] = value
-            await websocket.send(pickle.dumps([param, value]))
+            await websocket.send(dumps([param, value]))
+            if changed:
+                _publish(param, value)
 
 
 async def run_server(host: str, port: int, label: str) -> None:
@@ -65,6 +160,9 @@ async def run_server(host: str, port: int, label: str) -> None:
         host,
         port,
         ping_interval=None,
+        # Refuse oversized frames before they are buffered; the check in handle_connection
+        # only covers servers that mount the handler without this limit.
+        max_size=MAX_MESSAGE_BYTES,
     ):
         await asyncio.Future()  # run forever
 
@@ -10,17 +10,44 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Optional
 
 from .mediator_client import MediatorClient
 
 ASCII_PREVIEW = os.getenv("DEFORUMATION_ASCII_PREVIEW", "0") == "1"
+ASCII_RAMP = "@%#*+=-:. "
+# gray level (0-255) -> ramp character byte
+ASCII_RAMP_TABLE = bytes(ord(ASCII_RAMP[level * (len(ASCII_RAMP) - 1) // 255]) for level in range(256))
 
 
 def latest_frame(frames_dir: Path) -> Path | None:
-    pngs = sorted(frames_dir.glob("*.png"))
-    return pngs[-1] if pngs else None
+    # Single pass over the directory; frame names are zero-padded so the max name is the newest.
+    with os.scandir(frames_dir) as entries:
+        newest = max(
+            (e.name for e in entries if e.name.endswith(".png") and not e.name.startswith(".")),
+            default=None,
+        )
+    return frames_dir / newest if newest else None
+
+
+class FrameWatcher:
+    """latest_frame() that only rescans when the directory's mtime changes."""
+
+    __slots__ = ("frames_dir", "_mtime_ns", "_latest")
+
+    def __init__(self, frames_dir: Path):
+        self.frames_dir = frames_dir
+        self._mtime_ns: Optional[int] = None
+        self._latest: Path | None = None
+
+    def latest(self) -> Path | None:
+        mtime_ns = os.stat(self.frames_dir).st_mtime_ns
+        if mtime_ns != self._mtime_ns:
+            self._latest = latest_frame(self.frames_dir)
+            self._mtime_ns = mtime_ns
+        return self._latest
 
 
 def ascii_from_image(path: Path, width: int = 80, height: int = 40) -> str:
@@ -31,81 +58,135 @@ def ascii_from_image(path: Path, width: int = 80, height: int = 40) -> str:
     try:
         img = Image.open(path).convert("L")
         img.thumbnail((width, height))
-        pixels = img.load()
-        chars = "@%#*+=-:. "
-        lines = []
-        for iy in range(img.height):
-            line_chars = []
-            for ix in range(img.width):
-                val = pixels[ix, iy] / 255.0
-                line_chars.append(chars[int(val * (len(chars) - 1))])
-            lines.append("".join(line_chars))
-        return "\n".join(lines)
+        # One C-level byte translation maps every gray level to its character.
+        text = img.tobytes().translate(ASCII_RAMP_TABLE).decode("ascii")
+        w = img.width
+        return "\n".join(text[i : i + w] for i in range(0, len(text), w))
     except Exception:
         return "(could not render preview)"
 
 
-async def fetch_live_values(client: MediatorClient) -> Dict[str, str]:
-    keys = ["strength", "cfg", "translation_x", "translation_y", "translation_z", "rotation_x", "rotation_y", "rotation_z", "fov"]
+LIVE_KEYS = ("strength", "cfg", "translation_x", "translation_y", "translation_z", "rotation_x", "rotation_y", "rotation_z", "fov")
+
+
+def _read_live_values(client: MediatorClient) -> Dict[str, str]:
+    try:
+        # One pipelined round-trip for every key.
+        return dict(zip(LIVE_KEYS, client.read_many(LIVE_KEYS)))
+    except Exception:
+        pass
     values = {}
-    loop = asyncio.get_event_loop()
-    for k in keys:
+    for k in LIVE_KEYS:
         try:
-            # run in thread to reuse sync client
-            values[k] = await loop.run_in_executor(None, client.read, k)
+            values[k] = client.read(k)
         except Exception:
             values[k] = "?"
     return values
 
 
+async def fetch_live_values(client: MediatorClient) -> Dict[str, str]:
+    # run in thread to reuse sync client
+    return await asyncio.get_running_loop().run_in_executor(None, _read_live_values, client)
+
+
+LIVE_CATEGORIES = (
+    ("Generation", ("strength", "cfg")),
+    ("Camera Position", ("translation_x", "translation_y", "translation_z")),
+    ("Camera Rotation", ("rotation_x", "rotation_y", "rotation_z")),
+    ("View", ("fov",)),
+)
+
+
+ARROW_UP = "↑"
+ARROW_DOWN = "↓"
+_NUMBER_TYPES = (int, float)
+
+
+def _as_number(val) -> Optional[float]:
+    # The mediator already returns numbers; only strings need parsing.
+    if type(val) in _NUMBER_TYPES:
+        return val
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _format_live_line(key: str, val, prev_val) -> str:
+    num_val = _as_number(val)
+    if num_val is None:
+        return "  %-16s: %s" % (key, val)
+    if prev_val != "?" and prev_val != val:
+        prev_num = _as_number(prev_val)
+        if prev_num is not None:
+            change = num_val - prev_num
+            if change > 0.001:
+                return "  %-16s: %7.3f %s %.3f" % (key, num_val, ARROW_UP, change)
+            if change < -0.001:
+                return "  %-16s: %7.3f %s %.3f" % (key, num_val, ARROW_DOWN, -change)
+    return "  %-16s: %7.3f" % (key, num_val)
+
+
 def format_live_display(values: Dict[str, str], prev_values: Dict[str, str]) -> str:
     """Format live parameter values with change indicators and velocity."""
     lines = ["\n=== Live Parameters ==="]
-    
-    categories = {
-        "Generation": ["strength", "cfg"],
-        "Camera Position": ["translation_x", "translation_y", "translation_z"],
-        "Camera Rotation": ["rotation_x", "rotation_y", "rotation_z"],
-        "View": ["fov"],
-    }
-    
-    for category, keys in categories.items():
+    for category, keys in LIVE_CATEGORIES:
         lines.append(f"\n{category}:")
         for key in keys:
-            if key not in values:
-                continue
-            val = values[key]
-            prev_val = prev_values.get(key, val)
-            
-            # Format value
-            try:
-                num_val = float(val)
-                formatted_val = f"{num_val:7.3f}"
-                
-                # Calculate change
-                if prev_val != "?" and prev_val != val:
-                    prev_num = float(prev_val)
-                    change = num_val - prev_num
-                    if abs(change) > 0.001:
-                        direction = "↑" if change > 0 else "↓"
-                        formatted_val += f" {direction} {abs(change):.3f}"
-            except (ValueError, TypeError):
-                formatted_val = str(val)
-            
-            lines.append(f"  {key:16s}: {formatted_val}")
-    
+            if key in values:
+                val = values[key]
+                lines.append(_format_live_line(key, val, prev_values.get(key, val)))
     return "\n".join(lines)
 
 
+class LiveDisplay:
+    """Realtime display drawn once, then patched in place line by line.
+
+    Each key owns a fixed terminal row (the layout of format_live_display with
+    every LIVE_KEYS entry present); later renders only rewrite rows whose text
+    changed instead of clearing the whole screen.
+    """
+
+    __slots__ = ("_rows", "_bottom", "_last")
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        row = 2  # leading blank line + header
+        for _category, keys in LIVE_CATEGORIES:
+            row += 2  # blank line + category label
+            for key in keys:
+                row += 1
+                self._rows[key] = row
+        self._bottom = row + 1
+        self._last: Dict[str, str] = {}
+
+    def render(self, values: Dict[str, str], prev_values: Dict[str, str]) -> str:
+        """ANSI text that brings the terminal up to date with `values`."""
+        full = {key: "?" for key in self._rows}
+        full.update(values)
+        if not self._last:
+            self._last = {
+                key: _format_live_line(key, full[key], prev_values.get(key, full[key])) for key in self._rows
+            }
+            return "\033[2J\033[H" + format_live_display(full, prev_values) + "\n"
+        out = []
+        for key, row in self._rows.items():
+            val = full[key]
+            line = _format_live_line(key, val, prev_values.get(key, val))
+            if line != self._last[key]:
+                self._last[key] = line
+                out.append(f"\033[{row};1H\033[K{line}")
+        if out:
+            out.append(f"\033[{self._bottom};1H")
+        return "".join(out)
+
+
 async def main_async(args):
     client = MediatorClient(args.host, args.port)
     frames_dir = detect_frames_dir(args.frames)
     if not frames_dir or not frames_dir.exists():
         raise SystemExit(f"Frames directory not found: {frames_dir}")
-    
-    last_printed = None
-    prev_values = {}
-    
+
     # Print header
     print("=" * 60)
     print("Defora Monitor CLI - Live Parameter Display")
@@ -114,17 +195,42 @@ async def main_async(args):
     print(f"Interval: {args.interval}s")
     print("=" * 60)
     
+    try:
+        await _monitor_loop(args, client, frames_dir)
+    finally:
+        # The sync client drives its own loop, so close it off this one.
+        await asyncio.get_running_loop().run_in_executor(None, client.close)
+
+
+async def _subscribe_loop(client: MediatorClient) -> None:
+    # Redraw only when the mediator pushes a change instead of polling every key per tick.
+    values = {key: "?" for key in LIVE_KEYS}
+    prev_values: Dict[str, str] = {}
+    display = LiveDisplay()
+    async for key, value in client.subscribe(LIVE_KEYS):
+        prev_values[key] = values[key]
+        values[key] = value
+        sys.stdout.write(display.render(values, prev_values))
+        sys.stdout.flush()
+
+
+async def _monitor_loop(args, client: MediatorClient, frames_dir: Path) -> None:
+    if args.realtime and args.subscribe:
+        await _subscribe_loop(client)
+        return
+    last_printed = None
+    prev_values = {}
+    watcher = FrameWatcher(frames_dir)
+    display = LiveDisplay()
     while True:
-        lf = latest_frame(frames_dir)
-        
         # Always fetch and display live values in real-time mode
         if args.realtime:
             live = await fetch_live_values(client)
-            # Clear screen for real-time updates
-            print("\033[2J\033[H", end="")  # ANSI clear screen and move cursor to home
-            print(format_live_display(live, prev_values))
+            # Redraw in place: only rows whose value changed are rewritten
+            sys.stdout.write(display.render(live, prev_values))
+            sys.stdout.flush()
             prev_values = live.copy()
-        elif lf and lf != last_printed:
+        elif (lf := watcher.latest()) and lf != last_printed:
             # Frame-based mode (original behavior)
             print(f"\nLatest frame: {lf}")
             if ASCII_PREVIEW:
@@ -144,6 +250,8 @@ def main():
     parser.add_argument("--port", default="8766", help="Mediator port")
     parser.add_argument("--interval", type=float, default=1.0, help="Polling interval seconds")
     parser.add_argument("--realtime", action="store_true", help="Enable real-time parameter display (continuously updates)")
+    parser.add_argument("--subscribe", action="store_true",
+                        help="With --realtime, let the mediator push changes instead of polling (mediator_server/mediator_mock only)")
     args = parser.parse_args()
     asyncio.run(main_async(args))
 
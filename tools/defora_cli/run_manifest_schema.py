@@ -24,29 +24,44 @@ from __future__ import annotations
 from typing import Any, Dict
 
 
-def _require_type(blob: Dict[str, Any], key: str, types, allow_missing: bool = False):
-    if allow_missing and key not in blob:
-        return
-    if key not in blob:
-        raise ValueError(f"Missing required field: {key}")
-    if not isinstance(blob[key], types):
-        raise ValueError(f"Field '{key}' must be of type {types}, got {type(blob[key])}")
+_MISSING = object()
+
+# (key, accepted types, optional) in the order fields are checked.
+_SPEC = (
+    ("status", (str,), False),
+    ("started_at", (str,), False),
+    ("model", (str,), False),
+    ("frame_count", (int,), False),
+    ("last_frame", (str,), True),
+    ("prompt_positive", (str,), True),
+    ("prompt_negative", (str,), True),
+    ("seed", (int,), True),
+    ("steps", (int,), True),
+    ("strength", (int, float), True),
+    ("cfg", (int, float), True),
+    ("tag", (str,), True),
+    ("notes", (str,), True),
+    ("metadata", (dict,), True),
+)
+
+
+def _field_error(key: str, types, value) -> ValueError:
+    if value is _MISSING:
+        return ValueError(f"Missing required field: {key}")
+    if len(types) == 1:
+        types = types[0]
+    return ValueError(f"Field '{key}' must be of type {types}, got {type(value)}")
 
 
 def validate_run_manifest(blob: Dict[str, Any]) -> Dict[str, Any]:
     """Raise ValueError if the blob does not conform."""
-    _require_type(blob, "status", str)
-    _require_type(blob, "started_at", str)
-    _require_type(blob, "model", str)
-    _require_type(blob, "frame_count", int)
-    _require_type(blob, "last_frame", str, allow_missing=True)
-    _require_type(blob, "prompt_positive", str, allow_missing=True)
-    _require_type(blob, "prompt_negative", str, allow_missing=True)
-    _require_type(blob, "seed", int, allow_missing=True)
-    _require_type(blob, "steps", int, allow_missing=True)
-    _require_type(blob, "strength", (int, float), allow_missing=True)
-    _require_type(blob, "cfg", (int, float), allow_missing=True)
-    _require_type(blob, "tag", str, allow_missing=True)
-    _require_type(blob, "notes", str, allow_missing=True)
-    _require_type(blob, "metadata", dict, allow_missing=True)
+    get = blob.get
+    for key, types, optional in _SPEC:
+        value = get(key, _MISSING)
+        if value is _MISSING:
+            if optional:
+                continue
+        elif type(value) in types or isinstance(value, types):
+            continue
+        raise _field_error(key, types, value)
     return blob
@@ -9,15 +9,20 @@ Usage:
   python -m defora_cli.stream_helper record --source /path/to/frames --output recording.mp4
 
 Notes:
-  - Expects frames named in sequence (e.g., frame_%05d.png) under --source.
-  - Uses a low-latency H.264 preset (zerolatency, small GOP).
+  - Expects frames named in sequence (e.g., frame_%05d.png) under --source;
+    .jpg/.webp sequences (frame seeder FORMAT=jpeg|webp) are picked up too.
+  - Uses a low-latency H.264 preset (zerolatency, small GOP); hardware encoders
+    (NVENC/QSV/VAAPI) are used when ffmpeg has them, else libx264 ultrafast.
   - Supports overlays, transitions, and recording while streaming.
 """
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import signal
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -25,6 +30,87 @@ PROC_FILE = Path(".stream_helper.pid")
 RECORD_PROC_FILE = Path(".stream_helper_record.pid")
 CONFIG_FILE = Path(".stream_helper_config.json")
 WEBRTC_PROC_FILE = Path(".stream_helper_webrtc.pid")
+FRAME_EXTS = (".png", ".jpg", ".webp")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+# Live encoder flag sets; hardware ones are preferred by --encoder auto in this order.
+ENCODERS = {
+    "nvenc": ["-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-zerolatency", "1"],
+    "qsv": ["-c:v", "h264_qsv", "-preset", "veryfast"],
+    "vaapi": ["-c:v", "h264_vaapi"],
+    "x264": ["-vcodec", "libx264", "-preset", "ultrafast", "-tune", "zerolatency"],
+}
+
+
+def terminate(pid: int) -> None:
+    """Send SIGTERM to `pid`; a process that already exited is not an error."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def running_pid(pid_file: Path, comm: Optional[str] = "ffmpeg") -> Optional[int]:
+    """Pid recorded in `pid_file` if that process is still alive, else None.
+
+    A stale pid file (process gone, or the pid reused by something other than
+    `comm` per /proc) is removed so start/status don't report a dead stream.
+    """
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        pid_file.unlink(missing_ok=True)
+        return None
+    try:
+        os.kill(pid, 0)
+        alive = True
+    except ProcessLookupError:
+        alive = False
+    except PermissionError:
+        alive = True  # exists, owned by another user
+    if alive and comm:
+        try:
+            alive = Path(f"/proc/{pid}/comm").read_text().strip() == comm
+        except OSError:
+            pass  # no procfs (macOS); trust the signal probe
+    if not alive:
+        pid_file.unlink(missing_ok=True)
+        return None
+    return pid
+
+
+def frame_ext(source: Path) -> str:
+    """Extension of the frame sequence in `source` (defaults to .png when none exist yet)."""
+    for ext in FRAME_EXTS:
+        if next(source.glob(f"frame_*{ext}"), None) is not None:
+            return ext
+    return FRAME_EXTS[0]
+
+
+def frame_pattern(source: Path) -> str:
+    return str(source / f"frame_%05d{frame_ext(source)}")
+
+
+@lru_cache(maxsize=1)
+def available_encoders() -> frozenset:
+    """h264_* encoders compiled into the local ffmpeg (probed once per process)."""
+    try:
+        out = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, check=False
+        ).stdout
+    except OSError:
+        return frozenset()
+    return frozenset(word for line in out.splitlines() for word in line.split()[1:2] if word.startswith("h264_"))
+
+
+def resolve_encoder(encoder: str = "auto") -> str:
+    """Map --encoder to a key of ENCODERS; auto picks the first usable hardware encoder."""
+    if encoder != "auto":
+        return encoder
+    present = available_encoders()
+    for name in ("nvenc", "qsv", "vaapi"):
+        if f"h264_{name}" in present and (name != "vaapi" or Path(VAAPI_DEVICE).exists()):
+            return name
+    return "x264"
 
 
 def detect_protocol(target: str) -> str:
@@ -42,22 +128,37 @@ def detect_protocol(target: str) -> str:
 
 
 def build_ffmpeg_cmd(source: Path, target: str, fps: int, resolution: Optional[str], protocol: Optional[str] = None, 
-                     overlay: Optional[str] = None, transition: Optional[str] = None) -> list[str]:
-    """Build ffmpeg command based on target protocol."""
+                     overlay: Optional[str] = None, transition: Optional[str] = None,
+                     encoder: str = "x264", pipe_size: Optional[str] = None) -> list[str]:
+    """Build ffmpeg command based on target protocol.
+
+    With `pipe_size` ("WxH"), `source` is a FIFO carrying raw rgb24 frames of
+    that size (frame seeder SEEDER_MODE=pipe) instead of a directory of images.
+    """
     if protocol is None:
         protocol = detect_protocol(target)
     
-    pattern = str(source / "frame_%05d.png")
-    
     # Base command for input
-    cmd = [
-        "ffmpeg",
-        "-re",
-        "-framerate",
-        str(fps),
-        "-i",
-        pattern,
-    ]
+    cmd = ["ffmpeg"]
+    if encoder == "vaapi":
+        cmd.extend(["-vaapi_device", VAAPI_DEVICE])
+    if pipe_size:
+        # The writer paces the pipe, so no -re.
+        cmd.extend([
+            "-f", "rawvideo",
+            "-pixel_format", "rgb24",
+            "-video_size", pipe_size,
+            "-framerate", str(fps),
+            "-i", str(source),
+        ])
+    else:
+        cmd.extend([
+            "-re",
+            "-framerate",
+            str(fps),
+            "-i",
+            frame_pattern(source),
+        ])
     
     # Add overlay if specified
     filter_complex = []
@@ -75,28 +176,31 @@ def build_ffmpeg_cmd(source: Path, target: str, fps: int, resolution: Optional[s
         elif transition == "dissolve":
             filter_complex.append(f"[0:v]fade=t=in:st=0:d=1[out]")
     
+    if encoder == "vaapi":
+        # Frames must be scaled in software and uploaded as NV12 surfaces.
+        upload = (f"scale={resolution.replace('x', ':')}," if resolution else "") + "format=nv12,hwupload"
+        if filter_complex:
+            filter_complex.append(f"[out]{upload}")
+        else:
+            cmd.extend(["-vf", upload])
+    
     if filter_complex:
         cmd.extend(["-filter_complex", ";".join(filter_complex)])
     
+    cmd.extend(ENCODERS[encoder])
     cmd.extend([
-        "-vcodec",
-        "libx264",
-        "-preset",
-        "veryfast",
-        "-tune",
-        "zerolatency",
         "-g",
         str(fps * 2),
         "-keyint_min",
         str(fps),
         "-sc_threshold",
         "0",
-        "-pix_fmt",
-        "yuv420p",
     ])
     
-    if resolution:
-        cmd.extend(["-s", resolution])
+    if encoder != "vaapi":
+        cmd.extend(["-pix_fmt", "yuv420p"])
+        if resolution:
+            cmd.extend(["-s", resolution])
     
     # Protocol-specific output options
     if protocol == "rtmp":
@@ -124,7 +228,7 @@ def build_ffmpeg_cmd(source: Path, target: str, fps: int, resolution: Optional[s
 def build_record_cmd(source: Path, output: Path, fps: int, resolution: Optional[str] = None, 
                       codec: str = "libx264", quality: str = "medium") -> list[str]:
     """Build ffmpeg command for recording to file."""
-    pattern = str(source / "frame_%05d.png")
+    pattern = frame_pattern(source)
     
     quality_presets = {
         "low": {"crf": "28", "preset": "veryfast"},
@@ -160,14 +264,17 @@ def build_record_cmd(source: Path, output: Path, fps: int, resolution: Optional[
 
 
 def start_stream(source: Path, target: str, fps: int, resolution: Optional[str], protocol: Optional[str] = None,
-                 overlay: Optional[str] = None, transition: Optional[str] = None) -> None:
-    if PROC_FILE.exists():
+                 overlay: Optional[str] = None, transition: Optional[str] = None, encoder: str = "auto",
+                 pipe_size: Optional[str] = None) -> None:
+    if running_pid(PROC_FILE) is not None:
         raise SystemExit("Stream already running (pid file exists). Stop first.")
     
     detected_protocol = protocol or detect_protocol(target)
     print(f"Starting stream with protocol: {detected_protocol}")
     
-    cmd = build_ffmpeg_cmd(source, target, fps, resolution, detected_protocol, overlay, transition)
+    detected_encoder = resolve_encoder(encoder)
+    print(f"Encoder: {detected_encoder}")
+    cmd = build_ffmpeg_cmd(source, target, fps, resolution, detected_protocol, overlay, transition, detected_encoder, pipe_size)
     print(f"Command: {' '.join(cmd)}")
     
     proc = subprocess.Popen(cmd)
@@ -179,6 +286,7 @@ def start_stream(source: Path, target: str, fps: int, resolution: Optional[str],
         "source": str(source),
         "target": target,
         "protocol": detected_protocol,
+        "encoder": detected_encoder,
         "fps": fps,
         "resolution": resolution,
     }
@@ -187,7 +295,7 @@ def start_stream(source: Path, target: str, fps: int, resolution: Optional[str],
 
 def start_record(source: Path, output: Path, fps: int, resolution: Optional[str] = None,
                  codec: str = "libx264", quality: str = "medium") -> None:
-    if RECORD_PROC_FILE.exists():
+    if running_pid(RECORD_PROC_FILE) is not None:
         raise SystemExit("Recording already running (pid file exists). Stop first.")
     
     print(f"Starting recording to {output}")
@@ -201,20 +309,20 @@ def start_record(source: Path, output: Path, fps: int, resolution: Optional[str]
 
 
 def stop_record() -> None:
-    if not RECORD_PROC_FILE.exists():
-        print("No recording pid file found.")
+    pid = running_pid(RECORD_PROC_FILE)
+    if pid is None:
+        print("Recording not running")
         return
-    pid = int(RECORD_PROC_FILE.read_text().strip())
     try:
-        subprocess.run(["kill", str(pid)], check=False)
+        terminate(pid)
         print(f"Stopped recording pid {pid}")
     finally:
         RECORD_PROC_FILE.unlink(missing_ok=True)
 
 
 def record_status() -> None:
-    if RECORD_PROC_FILE.exists():
-        pid = RECORD_PROC_FILE.read_text().strip()
+    pid = running_pid(RECORD_PROC_FILE)
+    if pid is not None:
         print(f"Recording running (pid {pid})")
     else:
         print("Recording not running")
@@ -230,7 +338,7 @@ def start_webrtc(source: Path, fps: int, resolution: Optional[str] = None, port:
     except ImportError:
         raise ImportError("aiortc and aiohttp required for WebRTC. Install with: pip install aiortc aiohttp")
     
-    if WEBRTC_PROC_FILE.exists():
+    if running_pid(WEBRTC_PROC_FILE, comm=None) is not None:
         raise SystemExit("WebRTC stream already running (pid file exists). Stop first.")
     
     print(f"Starting WebRTC stream server on port {port}")
@@ -279,7 +387,7 @@ def start_webrtc(source: Path, fps: int, resolution: Optional[str] = None, port:
                 pcs.discard(pc)
         
         # Add video track from frames
-        pattern = str(source / "frame_%05d.png")
+        pattern = frame_pattern(source)
         player = MediaPlayer(pattern, format="image2", options={"framerate": str(fps)})
         pc.addTrack(player.video)
         
@@ -306,7 +414,6 @@ def start_webrtc(source: Path, fps: int, resolution: Optional[str] = None, port:
     server_thread = threading.Thread(target=run_server, daemon=True)
     server_thread.start()
     
-    import os
     WEBRTC_PROC_FILE.write_text(str(os.getpid()))
     print(f"WebRTC server started (pid {os.getpid()})")
     print(f"Open http://localhost:{port} to view stream")
@@ -321,12 +428,12 @@ def start_webrtc(source: Path, fps: int, resolution: Optional[str] = None, port:
 
 def stop_webrtc() -> None:
     """Stop WebRTC streaming."""
-    if not WEBRTC_PROC_FILE.exists():
-        print("No WebRTC stream pid file found.")
+    pid = running_pid(WEBRTC_PROC_FILE, comm=None)
+    if pid is None:
+        print("WebRTC stream not running")
         return
-    pid = int(WEBRTC_PROC_FILE.read_text().strip())
     try:
-        subprocess.run(["kill", str(pid)], check=False)
+        terminate(pid)
         print(f"Stopped WebRTC stream pid {pid}")
     finally:
         WEBRTC_PROC_FILE.unlink(missing_ok=True)
@@ -334,29 +441,30 @@ def stop_webrtc() -> None:
 
 def webrtc_status() -> None:
     """Check WebRTC streaming status."""
-    if WEBRTC_PROC_FILE.exists():
-        pid = WEBRTC_PROC_FILE.read_text().strip()
+    pid = running_pid(WEBRTC_PROC_FILE, comm=None)
+    if pid is not None:
         print(f"WebRTC stream running (pid {pid})")
     else:
         print("WebRTC stream not running")
 
 
 def stop_stream() -> None:
-    if not PROC_FILE.exists():
-        print("No stream pid file found.")
+    # Only signal the pid if it is still ours; a reused pid must never get SIGTERM.
+    pid = running_pid(PROC_FILE)
+    if pid is None:
+        print("Stream not running")
         return
-    pid = int(PROC_FILE.read_text().strip())
     try:
-        subprocess.run(["kill", str(pid)], check=False)
+        terminate(pid)
         print(f"Stopped stream pid {pid}")
     finally:
         PROC_FILE.unlink(missing_ok=True)
 
 
 def estimate_kbps(source: Path, fps: int) -> Optional[float]:
-    """Rough outbound bitrate estimate from recent frame PNG sizes."""
+    """Rough outbound bitrate estimate from recent frame file sizes."""
     try:
-        frames = sorted(source.glob("frame_*.png"))
+        frames = sorted(source.glob(f"frame_*{frame_ext(source)}"))
         if not frames:
             return None
         sample = frames[-min(8, len(frames)) :]
@@ -371,23 +479,19 @@ def estimate_kbps(source: Path, fps: int) -> Optional[float]:
 
 
 def status_payload() -> Dict:
-    running = PROC_FILE.exists()
+    pid = running_pid(PROC_FILE)
+    running = pid is not None
     payload: Dict = {
         "running": running,
         "status": "running" if running else "stopped",
         "health": "healthy" if running else "offline",
-        "pid": None,
+        "pid": pid,
         "target": None,
         "protocol": None,
         "fps": None,
         "kbps": None,
         "resolution": None,
     }
-    if running:
-        try:
-            payload["pid"] = int(PROC_FILE.read_text().strip())
-        except (TypeError, ValueError):
-            payload["pid"] = None
     if CONFIG_FILE.exists():
         try:
             config = json.loads(CONFIG_FILE.read_text())
@@ -428,6 +532,10 @@ def main():
     start.add_argument("--protocol", choices=["rtmp", "srt", "whip"], help="Force specific protocol (auto-detected if not specified)")
     start.add_argument("--overlay", help="Path to overlay image (PNG with transparency)")
     start.add_argument("--transition", choices=["fade", "wipe", "dissolve"], help="Transition effect to apply")
+    start.add_argument("--pipe", metavar="WxH", dest="pipe_size",
+                       help="--source is a FIFO of raw rgb24 frames this size (frame seeder SEEDER_MODE=pipe)")
+    start.add_argument("--encoder", choices=["auto", *ENCODERS], default="auto",
+                       help="H.264 encoder (auto prefers NVENC/QSV/VAAPI, falls back to x264)")
 
     sub.add_parser("stop", help="Stop streaming")
     status_parser = sub.add_parser("status", help="Show streaming status")
@@ -457,7 +565,7 @@ def main():
     if args.command == "start":
         start_stream(Path(args.source), args.target, args.fps, args.resolution, 
                      getattr(args, "protocol", None), getattr(args, "overlay", None), 
-                     getattr(args, "transition", None))
+                     getattr(args, "transition", None), args.encoder, args.pipe_size)
     elif args.command == "stop":
         stop_stream()
     elif args.command == "status":